@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
+import multiprocessing
 import os
 import statistics as stats
 import threading
 import time
+from array import array
 
 import metabridge as meta
 
@@ -11,6 +15,15 @@ import metabridge as meta
 import service_daemon
 
 
+def _p95(values):
+    """
+    Percentil 95 com o mesmo índice de `sorted(values)[int(0.95 * (n - 1))]`,
+    mas mantendo só os 5% maiores num heap em vez de ordenar todas as amostras.
+    """
+    n = len(values)
+    return heapq.nlargest(n - int(0.95 * (n - 1)), values)[-1]
+
+
 def bench_latency(n=200):
     c = meta.connect("demo-service", argumento="ping", timeout=3.0)
 
@@ -18,69 +31,148 @@ def bench_latency(n=200):
     for _ in range(20):
         c.get("warmup")
 
-    times = []
-    for _ in range(n):
-        t0 = time.perf_counter()
+    # Inteiros em nanossegundos num array pré-alocado: nada é alocado dentro da região medida.
+    times_ns = array("q", bytes(8 * n))
+    for i in range(n):
+        t0 = time.perf_counter_ns()
         c.get("warmup")
-        times.append((time.perf_counter() - t0) * 1e3)
+        times_ns[i] = time.perf_counter_ns() - t0
 
+    # A conversão para milissegundos só acontece depois das medições.
+    times = [t / 1e6 for t in times_ns]
     return {
         "n": n,
         "p50_ms": stats.median(times),
-        "p95_ms": sorted(times)[int(0.95 * (n - 1))],
+        "p95_ms": _p95(times),
         "avg_ms": sum(times) / len(times),
         "min_ms": min(times),
         "max_ms": max(times),
     }
 
 
-def bench_throughput(concurrency=16, duration=2.0):
-    stop = time.perf_counter() + duration
-    counts = [0] * concurrency
+# Os workers rodam em processos próprios (fork) para que a codificação das chamadas
+# no cliente não dispute o mesmo GIL; sem fork disponível, cai para threads.
+_FORK_CTX = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+
+
+def _start_workers(target, concurrency, *args):
+    if _FORK_CTX is not None:
+        workers = [_FORK_CTX.Process(target=target, args=(i, *args), daemon=True) for i in range(concurrency)]
+    else:
+        workers = [threading.Thread(target=target, args=(i, *args), daemon=True) for i in range(concurrency)]
+    for w in workers:
+        w.start()
+    return workers
+
+
+def _new_counts(concurrency):
+    # Memória compartilhada sem lock: cada worker escreve apenas no próprio slot.
+    ctx = _FORK_CTX or multiprocessing
+    return ctx.Array("q", concurrency, lock=False)
+
+
+# Os laços de carga consultam o relógio só a cada N operações, não a cada chamada.
+_STOP_CHECK_EVERY = 64
 
-    def worker(i):
-        c = meta.connect("demo-service", argumento="pong", timeout=3.0)
+
+def _throughput_worker(i, stop, counts, depth=32):
+    c = meta.connect("demo-service", argumento="pong", timeout=3.0)
+    # Contador local; o slot compartilhado só é escrito ao final.
+    done = 0
+    # Pipelining: `depth` requisições saem antes de qualquer resposta ser lida;
+    # o relógio é consultado uma vez por rajada.
+    with c.pipeline(depth=depth) as p:
         while time.perf_counter() < stop:
-            c.get("warmup")
-            counts[i] += 1
+            futs = [p.call("get", "warmup") for _ in range(depth)]
+            for f in futs:
+                f.result()
+            done += depth
+    counts[i] = done
+
+
+def bench_throughput(concurrency=16, duration=2.0):
+    stop = time.perf_counter() + duration
+    counts = _new_counts(concurrency)
 
-    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(concurrency)]
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
+    for w in _start_workers(_throughput_worker, concurrency, stop, counts):
+        w.join()
 
     total = sum(counts)
     return {"concurrency": concurrency, "duration_s": duration, "ops": total, "ops_per_sec": total / duration}
 
 
+def _async_throughput_worker(i, stop, counts, in_flight):
+    async def run_worker():
+        async with meta.AsyncServiceClient("demo-service", argumento="pong", timeout=3.0) as c:
+
+            async def caller():
+                done = 0
+                while time.perf_counter() < stop:
+                    for _ in range(_STOP_CHECK_EVERY):
+                        await c.get("pong")
+                    done += _STOP_CHECK_EVERY
+                return done
+
+            counts[i] = sum(await asyncio.gather(*(caller() for _ in range(in_flight))))
+
+    asyncio.run(run_worker())
+
+
+def bench_async_throughput(concurrency=16, duration=2.0, in_flight=32):
+    """
+    Mede a vazão com um AsyncServiceClient por worker, mantendo várias chamadas
+    em voo no mesmo socket em vez de esperar cada resposta antes de enviar a próxima.
+    """
+    stop = time.perf_counter() + duration
+    counts = _new_counts(concurrency)
+
+    for w in _start_workers(_async_throughput_worker, concurrency, stop, counts, in_flight):
+        w.join()
+
+    total = sum(counts)
+    return {
+        "concurrency": concurrency,
+        "in_flight": in_flight,
+        "duration_s": duration,
+        "ops": total,
+        "ops_per_sec": total / duration,
+    }
+
+
+def _bottleneck_worker(i, stop, results):
+    # Cada worker obtém sua própria conexão de cliente.
+    c = meta.connect("demo-service", argumento="stress", timeout=5.0)
+    get = c.get
+    # Latências em nanossegundos: um lote pré-alocado por verificação de parada.
+    batch = array("q", bytes(8 * _STOP_CHECK_EVERY))
+    local_times = array("q")
+    while time.perf_counter() < stop:
+        for k in range(_STOP_CHECK_EVERY):
+            t0 = time.perf_counter_ns()
+            get("payload")
+            batch[k] = time.perf_counter_ns() - t0
+        local_times.extend(batch)
+    results.put(local_times)
+
+
 def bench_bottleneck(concurrency=32, duration=5.0):
     """
     Mede a latência e a vazão sob alta carga concorrente para identificar gargalos.
-    Este teste envia o máximo de requisições possível de múltiplos threads simultaneamente.
+    Este teste envia o máximo de requisições possível de múltiplos workers simultaneamente.
     """
     stop = time.perf_counter() + duration
-    # Cada thread terá sua própria lista para armazenar resultados, evitando contenção de locks.
-    results = [[] for _ in range(concurrency)]
-
-    def worker(i):
-        # Cada thread obtém sua própria conexão de cliente.
-        c = meta.connect("demo-service", argumento="stress", timeout=5.0)
-        while time.perf_counter() < stop:
-            t0 = time.perf_counter()
-            c.get("payload")
-            # Armazena a latência em milissegundos.
-            results[i].append((time.perf_counter() - t0) * 1e3)
+    # Cada worker mede numa lista local e a envia uma única vez, ao final.
+    results = (_FORK_CTX or multiprocessing).SimpleQueue()
 
     print(f"  Executando com {concurrency} clientes concorrentes por {duration} segundos...")
-    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(concurrency)]
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
+    workers = _start_workers(_bottleneck_worker, concurrency, stop, results)
+    # Lê antes do join para que nenhum worker fique bloqueado escrevendo no pipe.
+    per_worker = [results.get() for _ in workers]
+    for w in workers:
+        w.join()
 
-    # Achata a lista de listas em uma única lista com todos os tempos medidos.
-    all_times = [t for thread_times in results for t in thread_times]
+    # Achata os arrays de cada worker numa única lista, já em milissegundos.
+    all_times = [t / 1e6 for worker_times in per_worker for t in worker_times]
 
     n = len(all_times)
     if n == 0:
@@ -96,13 +188,48 @@ def bench_bottleneck(concurrency=32, duration=5.0):
         "total_ops": n,
         "ops_per_sec": n / duration,
         "p50_ms": stats.median(all_times),
-        "p95_ms": sorted(all_times)[int(0.95 * (n - 1))],
+        "p95_ms": _p95(all_times),
         "avg_ms": sum(all_times) / n,
         "min_ms": min(all_times),
         "max_ms": max(all_times),
     }
 
 
+def bench_lru_cache_stress(rounds=2000, hot_keys=2, scan_every=4):
+    """
+    Estressa o cache de instâncias do servidor: chamadas a poucas instâncias "quentes"
+    intercaladas com argumentos de construtor usados uma única vez (varredura).
+    """
+    hot = [meta.connect("demo-service", argumento=f"hot_{k}", timeout=3.0) for k in range(hot_keys)]
+    try:
+        before = hot[0].cache_stats().get("get", {})
+        t0 = time.perf_counter()
+        for i in range(rounds):
+            if i % scan_every == 0:
+                with meta.connect("demo-service", argumento=f"scan_{i}", timeout=3.0) as c:
+                    c.get("scan")
+            else:
+                hot[i % hot_keys].get("hot")
+        elapsed = time.perf_counter() - t0
+        after = hot[0].cache_stats().get("get", {})
+    finally:
+        for c in hot:
+            c.close()
+
+    hits = after.get("hits", 0) - before.get("hits", 0)
+    misses = after.get("misses", 0) - before.get("misses", 0)
+    return {
+        "rounds": rounds,
+        "elapsed_s": elapsed,
+        "ops_per_sec": rounds / elapsed,
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+        "evictions": after.get("evictions", 0),
+        "size": after.get("size", 0),
+    }
+
+
 if __name__ == "__main__":
     print("Iniciando o serviço daemon para os benchmarks...")
     # Define o número de workers do servidor. O benchmark usará mais clientes do que workers para criar estresse.
@@ -119,10 +246,18 @@ if __name__ == "__main__":
     thr = bench_throughput()
     print(f"Vazão: {thr}")
 
+    print("\n--- Benchmark de Vazão (asyncio com pipelining) ---")
+    athr = bench_async_throughput()
+    print(f"Vazão assíncrona: {athr}")
+
     print("\n--- Benchmark de Gargalo (Alta Concorrência) ---")
     bottle = bench_bottleneck()
     print(f"Gargalo: {bottle}")
 
+    print("\n--- Benchmark do Cache de Instâncias (varredura) ---")
+    lru = bench_lru_cache_stress()
+    print(f"Cache: {lru}")
+
     # Encerra o serviço de forma limpa após a conclusão dos benchmarks.
     service_daemon.handle.stop()
     print("\nServiço daemon encerrado.")
\ No newline at end of file
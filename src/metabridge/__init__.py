@@ -2,17 +2,25 @@
 """MetaBridge - High-performance in-memory service pipes for intra-project function calls."""
 from __future__ import annotations
 
-import inspect
+from types import FunctionType
 from typing import Any, Callable, Dict, Optional, overload
 
-from .client import ServiceClient, connect_service
+from .client import AsyncServiceClient, ServiceClient, connect_service
 from .exceptions import (
     MetaBridgeError,
     RemoteExecutionError,
     ServiceAlreadyExists,
     ServiceNotFound,
 )
-from .server import DaemonHandle, DaemonServiceBuilder, ServiceBuilder, create_service
+from .protocol import BinaryResult
+from .server import (
+    _ENDPOINT_META,
+    DaemonHandle,
+    DaemonServiceBuilder,
+    ServiceBuilder,
+    _EndpointMeta,
+    create_service,
+)
 
 __all__ = [
     "MetaBridgeError",
@@ -22,6 +30,8 @@ __all__ = [
     "ServiceBuilder",
     "DaemonHandle",
     "ServiceClient",
+    "AsyncServiceClient",
+    "BinaryResult",
     "create",
     "run",
     "connect",
@@ -29,12 +39,15 @@ __all__ = [
     "function",  # Adicionado para clareza
 ]
 
+# Nomes exportados nunca viram decoradores dinâmicos; frozenset para lookup O(1).
+_BLOCKED_NAMES = frozenset(__all__)
+
 
 def _mark_endpoint(func: Callable[..., Any], alias: Optional[str]) -> Callable[..., Any]:
     """Internal helper to attach metadata to a function."""
     # Se alias for None, o nome do endpoint será o nome da função.
     # Se for uma string, será o alias.
-    setattr(func, "metabridge_endpoint", alias)
+    _ENDPOINT_META[func] = _EndpointMeta(alias or func.__name__)
     return func
 
 
@@ -75,7 +88,7 @@ def __getattr__(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]
     Provides dynamic decorators for endpoints (e.g., @meta.get, @meta.test).
     The attribute name becomes the endpoint name.
     """
-    if name.startswith("_") or name in __all__:
+    if not name or name[0] == "_" or name in _BLOCKED_NAMES:
         raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -96,9 +109,11 @@ class _ServiceRegistration:
         self._class: Optional[type] = None
         self._seen_endpoints: set[str] = set()
 
+    def close(self) -> None:
+        self._builder.close()
+
     def daemon(self) -> "_ServiceClassDecorator":
-        if self._daemon_builder is None:
-            self._daemon_builder = self._builder.daemon()
+        self._ensure_daemon_builder()
         return _ServiceClassDecorator(self)
 
     def _ensure_daemon_builder(self) -> DaemonServiceBuilder:
@@ -108,26 +123,27 @@ class _ServiceRegistration:
 
     def _register_class(self, cls: type) -> type:
         self._class = cls
-        self._seen_endpoints.clear()
-        builder = self._ensure_daemon_builder()
+        seen = self._seen_endpoints
+        seen.clear()
+        register = self._ensure_daemon_builder()._register_endpoint
 
         for attr_name, member in cls.__dict__.items():
             func, descriptor = _extract_callable(member)
-            if func is None or not hasattr(func, "metabridge_endpoint"):
+            meta = _ENDPOINT_META.get(func) if func is not None else None
+            if meta is None:
                 continue
 
-            endpoint_name = getattr(func, "metabridge_endpoint")
-            _annotate_endpoint(func, cls, attr_name, descriptor)
+            endpoint_name = meta.endpoint
+            _annotate_endpoint(meta, cls, attr_name, descriptor)
 
             # O nome do endpoint é o alias ou o nome da função.
             # Também registramos o nome do atributo como um alias implícito.
-            names_to_register = {endpoint_name, attr_name}
-
-            for endpoint in names_to_register:
-                if endpoint in self._seen_endpoints:
-                    continue
-                builder._register_endpoint(endpoint, func)
-                self._seen_endpoints.add(endpoint)
+            if endpoint_name not in seen:
+                register(endpoint_name, func)
+                seen.add(endpoint_name)
+            if attr_name != endpoint_name and attr_name not in seen:
+                register(attr_name, func)
+                seen.add(attr_name)
         return cls
 
     def run(
@@ -136,10 +152,14 @@ class _ServiceRegistration:
         wait: bool = False,
         poll_interval: float = 0.5,
         startup_timeout: float = 5.0,
+        processes: int = 1,
     ) -> DaemonHandle:
         builder = self._ensure_daemon_builder()
         return builder.run(
-            wait=wait, poll_interval=poll_interval, startup_timeout=startup_timeout
+            wait=wait,
+            poll_interval=poll_interval,
+            startup_timeout=startup_timeout,
+            processes=processes,
         )
 
 
@@ -151,22 +171,35 @@ class _ServiceClassDecorator:
         return self._registration._register_class(cls)
 
 
+_DESCRIPTOR_KINDS: Dict[type, str] = {
+    staticmethod: "staticmethod",
+    classmethod: "classmethod",
+    FunctionType: "instance",
+}
+
+
 def _extract_callable(member: Any) -> tuple[Optional[Callable[..., Any]], str]:
-    if isinstance(member, staticmethod):
-        return member.__func__, "staticmethod"
-    if isinstance(member, classmethod):
-        return member.__func__, "classmethod"
-    if inspect.isfunction(member):
-        return member, "instance"
-    return None, ""
+    # Uma consulta pelo tipo exato resolve quase todos os membros; subclasses
+    # (raras) caem na verificação por isinstance abaixo.
+    kind = _DESCRIPTOR_KINDS.get(type(member))
+    if kind is None:
+        for base, base_kind in _DESCRIPTOR_KINDS.items():
+            if isinstance(member, base):
+                kind = base_kind
+                break
+        else:
+            return None, ""
+    if kind == "instance":
+        return member, kind
+    return member.__func__, kind
 
 
 def _annotate_endpoint(
-    func: Callable[..., Any], owner: type, attr_name: str, descriptor: str
+    meta: _EndpointMeta, owner: type, attr_name: str, descriptor: str
 ) -> None:
-    setattr(func, "metabridge_owner", owner)
-    setattr(func, "metabridge_attr", attr_name)
-    setattr(func, "metabridge_descriptor", descriptor)
+    meta.owner = owner
+    meta.attr = attr_name
+    meta.descriptor = descriptor
 
 
 _SERVICE_REGISTRY: Dict[str, _ServiceRegistration] = {}
@@ -179,8 +212,13 @@ def create(
     """Create (or retrieve) a MetaBridge service registration for the given name."""
     registration = _SERVICE_REGISTRY.get(name)
     if registration is None:
-        registration = _ServiceRegistration(name, host=host, logger=logger)
-        _SERVICE_REGISTRY[name] = registration
+        candidate = _ServiceRegistration(name, host=host, logger=logger)
+        # setdefault é atômico sob o GIL: se outra thread registrou o mesmo nome
+        # primeiro, a dela prevalece e o servidor extra é descartado.
+        registration = _SERVICE_REGISTRY.setdefault(name, candidate)
+        if registration is not candidate:
+            candidate.close()
+            registration._builder.republish()
     global _LAST_REGISTRATION
     _LAST_REGISTRATION = registration
     return registration
@@ -205,11 +243,15 @@ def run(
     wait: bool = False,
     poll_interval: float = 0.5,
     startup_timeout: float = 5.0,
+    processes: int = 1,
 ) -> DaemonHandle:
     """Launch the given service in daemon mode."""
     registration = _resolve_registration(name)
     return registration.run(
-        wait=wait, poll_interval=poll_interval, startup_timeout=startup_timeout
+        wait=wait,
+        poll_interval=poll_interval,
+        startup_timeout=startup_timeout,
+        processes=processes,
     )
 
 
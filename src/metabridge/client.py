@@ -2,16 +2,417 @@
 """High-performance client for MetaBridge services using sockets."""
 from __future__ import annotations
 
+import asyncio
+import functools
 import socket
-import struct
-from contextlib import contextmanager
-from queue import Full, Queue
-from typing import Any, Callable, Dict, Generator, List
-
-import msgpack
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, suppress
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from weakref import WeakValueDictionary
+
+import msgspec
 
 from .exceptions import RemoteExecutionError, ServiceNotFound
-from .registry import resolve_service
+from .logger import get_logger
+from .protocol import (
+    ENCODER,
+    ERROR_OVERLOADED,
+    LENGTH_PREFIX,
+    RESPONSE_DECODER,
+    STATUS_OK,
+    CacheStatsRequest,
+    CallRequest,
+    ListEndpointsRequest,
+    Request,
+    Response,
+    preencode,
+    send_frames,
+    send_message,
+)
+from .registry import ServiceRecord, resolve_service
+
+# Requests written back-to-back before their responses are drained; bounded so
+# neither side can fill its send buffer while the other is still writing.
+_BATCH_WINDOW = 128
+_BATCH_WINDOW_BYTES = 256 * 1024
+
+# Registry lookups touch the registry file; records are reused until a
+# connection attempt shows they are out of date.
+_SERVICE_CACHE: Dict[str, ServiceRecord] = {}
+
+
+def _resolve_cached(name: str, *, refresh: bool = False) -> ServiceRecord:
+    """Return the registry record for ``name``, from the local cache if possible."""
+    if not refresh:
+        record = _SERVICE_CACHE.get(name)
+        if record is not None:
+            return record
+    _SERVICE_CACHE.pop(name, None)
+    record = resolve_service(name)
+    _SERVICE_CACHE[name] = record
+    return record
+
+
+# A pooled socket together with the monotonic time it was last returned
+_PooledSocket = Tuple[socket.socket, float]
+
+# Default kernel buffer size for client sockets, set before connect(); large
+# responses then arrive in one or two recv calls instead of many.
+_DEFAULT_SOCKET_BUFFER_SIZE = 1 << 20
+
+
+def _set_buffer_sizes(sock: socket.socket, size: int) -> None:
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, size)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, size)
+
+
+def _buffer_sizes_clamped(sock: socket.socket, size: int) -> bool:
+    """Whether the kernel granted less than ``size`` for either buffer."""
+    # Linux reports double the requested value (bookkeeping overhead), so only a
+    # value below the request means it was capped by net.core.{r,w}mem_max.
+    return (
+        sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) < size
+        or sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF) < size
+    )
+
+
+# Linux-only: ACK immediately instead of delaying, so the peer's next segment
+# isn't held back. The kernel clears the flag again, hence re-arming per call.
+_TCP_QUICKACK = getattr(socket, "TCP_QUICKACK", None)
+
+
+# Ask the kernel to fill the whole buffer in one call where the platform supports it
+_MSG_WAITALL = getattr(socket, "MSG_WAITALL", 0)
+
+
+# Responses up to this size are received into a reusable per-thread buffer;
+# larger ones get a one-off allocation so a single big reply isn't kept alive.
+_RECV_BUFFER_LIMIT = 1024 * 1024
+_recv_buffers = threading.local()
+
+
+def _receive_buffer(size: int) -> memoryview:
+    """Return a writable view of ``size`` bytes, reusing this thread's buffer."""
+    if size > _RECV_BUFFER_LIMIT:
+        return memoryview(bytearray(size))
+    buffer = getattr(_recv_buffers, "buffer", None)
+    if buffer is None or len(buffer) < size:
+        buffer = bytearray(max(size, 4096))
+        _recv_buffers.buffer = buffer
+    return memoryview(buffer)[:size]
+
+
+def _recv_exactly(sock: socket.socket, view: memoryview, closed_message: str) -> None:
+    """Fill ``view`` completely from ``sock``."""
+    size = len(view)
+    received = sock.recv_into(view, size, _MSG_WAITALL)
+    if received == size:
+        return
+
+    # MSG_WAITALL may still return short (timeouts, signals): finish the read by hand
+    while received < size:
+        n = sock.recv_into(view[received:], size - received, _MSG_WAITALL)
+        if not n:
+            raise RemoteExecutionError(closed_message)
+        received += n
+
+
+# Read size used when a socket has exactly one response outstanding.
+_SOLE_READ_SIZE = 64 * 1024
+
+
+def _read_sole_response(sock: socket.socket) -> Response:
+    """
+    Read the only response outstanding on ``sock``.
+
+    Nothing can follow this frame on the wire, so header and body are read
+    with a single ``recv_into`` instead of one exact read for each; only
+    replies that arrive fragmented pay for further reads.
+    """
+    view = _receive_buffer(_SOLE_READ_SIZE)
+    received = sock.recv_into(view)
+    if not received:
+        raise RemoteExecutionError("Connection closed by server")
+    if received < 4:
+        _recv_exactly(sock, view[received:4], "Connection closed by server")
+        received = 4
+
+    end = 4 + LENGTH_PREFIX.unpack_from(view)[0]
+    if end > len(view):
+        # Larger than the shared buffer: move what arrived into a dedicated one
+        body = memoryview(bytearray(end - 4))
+        body[: received - 4] = view[4:received]
+        _recv_exactly(sock, body[received - 4 :], "Connection closed while reading response")
+        return RESPONSE_DECODER.decode(body)
+    if received < end:
+        _recv_exactly(sock, view[received:end], "Connection closed while reading response")
+    return RESPONSE_DECODER.decode(view[4:end])
+
+
+class _FrameReader:
+    """
+    Reads consecutive response frames from one socket through its own buffer.
+
+    Each ``recv_into`` takes whatever the kernel holds, so replies the server
+    sent together are parsed from a single read instead of costing two exact
+    reads (header, then body) apiece.
+    """
+
+    __slots__ = ("_sock", "_buffer", "_start", "_end")
+
+    def __init__(self, sock: socket.socket) -> None:
+        self._sock = sock
+        self._buffer = bytearray(_SOLE_READ_SIZE)
+        self._start = 0
+        self._end = 0
+
+    def read(self) -> Response:
+        buffer, start, end = self._buffer, self._start, self._end
+        while True:
+            available = end - start
+            needed = 4
+            if available >= 4:
+                needed += LENGTH_PREFIX.unpack_from(buffer, start)[0]
+                if available >= needed:
+                    frame_end = start + needed
+                    if frame_end == end:
+                        self._start = self._end = 0
+                    else:
+                        self._start, self._end = frame_end, end
+                    return RESPONSE_DECODER.decode(memoryview(buffer)[start + 4 : frame_end])
+
+            if len(buffer) - start < needed:
+                # Make room for the rest of the frame at the front of the buffer
+                if needed > len(buffer):
+                    grown = bytearray(needed)
+                    grown[:available] = buffer[start:end]
+                    buffer = self._buffer = grown
+                else:
+                    buffer[:available] = buffer[start:end]
+                start, end = 0, available
+
+            received = self._sock.recv_into(memoryview(buffer)[end:])
+            if not received:
+                raise RemoteExecutionError("Connection closed by server")
+            end += received
+
+
+def _unwrap_response(service: str, endpoint: str, response: Response) -> Any:
+    """Return the result of a call response or raise its remote error."""
+    if response.status == STATUS_OK:
+        return response.result
+
+    error_type, message = response.error if len(response.error) == 2 else (None, None)
+    raise RemoteExecutionError(
+        f"Remote call to '{service}.{endpoint}' failed:\n"
+        f"  Type: {error_type}\n"
+        f"  Message: {message}"
+    )
+
+
+def _is_rejection(response: Response) -> bool:
+    """Whether the server turned the request away (and is closing the connection)."""
+    return response.status != STATUS_OK and response.error[:1] == (ERROR_OVERLOADED,)
+
+
+class _Rejected(Exception):
+    """Carries an overload reply out of ``_managed_socket`` so its socket is closed."""
+
+    def __init__(self, response: Response) -> None:
+        super().__init__(response)
+        self.response = response
+
+
+# The per-call part of a request is only ``args``/``kwargs``: everything else is
+# a compile-time constant or pre-encoded ``Raw``. Splicing a pre-encoded byte
+# prefix by hand was measured and is slower than letting msgspec encode the
+# Struct in one C call, so the stub just instantiates it.
+_STUB_TEMPLATE = """
+def {func_name}(*args, **kwargs):
+    response = _send_request(_CallRequest({endpoint!r}, args, kwargs, _ctor_args, _ctor_kwargs))
+    if response.status == {status_ok}:
+        return response.result
+    return _unwrap_response(_service, {endpoint!r}, response)
+"""
+
+
+def _compile_stubs(client: "ServiceClient", endpoints: Iterable[str]) -> Dict[str, Callable[..., Any]]:
+    """
+    Generate one specialised function per endpoint of ``client``.
+
+    Each stub has its endpoint name compiled in as a constant and reads the
+    client's pre-encoded constructor arguments and bound ``_send_request`` from
+    its globals, so a call builds the request and checks the status inline
+    without going through a generic proxy's attribute loads.
+    """
+    endpoints = list(endpoints)
+    source = "".join(
+        _STUB_TEMPLATE.format(func_name=f"_endpoint_{index}", endpoint=endpoint, status_ok=STATUS_OK)
+        for index, endpoint in enumerate(endpoints)
+    )
+    namespace: Dict[str, Any] = {
+        "_send_request": client._send_request,
+        "_CallRequest": CallRequest,
+        "_ctor_args": client._ctor_args_raw,
+        "_ctor_kwargs": client._ctor_kwargs_raw,
+        "_service": client._name,
+        "_unwrap_response": _unwrap_response,
+    }
+    exec(compile(source, f"<metabridge stubs for {client._name!r}>", "exec"), namespace)
+
+    stubs: Dict[str, Callable[..., Any]] = {}
+    for index, endpoint in enumerate(endpoints):
+        stub = namespace[f"_endpoint_{index}"]
+        stub.__name__ = stub.__qualname__ = endpoint
+        stubs[endpoint] = stub
+    return stubs
+
+
+class PipelinedCall:
+    """Pending result of a call issued through ``ServiceClient.pipeline()``."""
+
+    __slots__ = ("_pipeline", "_endpoint", "_done", "_value", "_error")
+
+    def __init__(self, pipeline: "_Pipeline", endpoint: str) -> None:
+        self._pipeline = pipeline
+        self._endpoint = endpoint
+        self._done = False
+        self._value: Any = None
+        self._error: Optional[BaseException] = None
+
+    def done(self) -> bool:
+        return self._done
+
+    def result(self) -> Any:
+        """Return the call's result, reading queued responses until it arrives."""
+        while not self._done:
+            self._pipeline._read_next()
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+
+class _Pipeline:
+    """
+    Keeps up to ``depth`` requests in flight on one pooled socket.
+
+    Requests are written as soon as they are issued; responses come back in
+    the same order and are matched to their ``PipelinedCall`` FIFO-style.
+    """
+
+    def __init__(self, client: "ServiceClient", depth: int) -> None:
+        self._client = client
+        self._depth = max(1, depth)
+        self._sock: Optional[socket.socket] = None
+        self._reader: Optional[_FrameReader] = None
+        self._pending: Deque[PipelinedCall] = deque()
+        # Why the socket was dropped, raised by calls issued afterwards
+        self._abort_error: Optional[RemoteExecutionError] = None
+
+    def __enter__(self) -> "_Pipeline":
+        if self._client._closed:
+            raise RuntimeError("ServiceClient is closed.")
+        # The socket is held for the whole block and only pooled again on exit.
+        self._sock = self._client._get_socket()
+        self._reader = _FrameReader(self._sock)
+        return self
+
+    def call(self, endpoint: str, *args: Any, **kwargs: Any) -> PipelinedCall:
+        """Send a call without waiting for its response."""
+        if self._sock is None:
+            raise RuntimeError("Pipeline is not active; use it as a context manager.")
+        if len(self._pending) >= self._depth:
+            self._read_next()
+            if self._sock is None:
+                # Reading the oldest response found the connection broken
+                assert self._abort_error is not None
+                raise self._abort_error
+
+        client = self._client
+        payload = CallRequest(endpoint, args, kwargs, client._ctor_args_raw, client._ctor_kwargs_raw)
+        pending = PipelinedCall(self, endpoint)
+        try:
+            send_message(self._sock, payload)
+        except OSError as exc:
+            self._abort(RemoteExecutionError(f"Request failed: {exc}"))
+            raise self._error_for(exc) from exc
+        self._pending.append(pending)
+        return pending
+
+    def drain(self) -> None:
+        """Read every outstanding response."""
+        while self._pending:
+            self._read_next()
+
+    def _read_next(self) -> None:
+        if not self._pending:
+            raise RuntimeError("No pipelined call is awaiting a response.")
+        pending = self._pending.popleft()
+        try:
+            response = self._reader.read()  # type: ignore[union-attr]
+        except (OSError, RemoteExecutionError, msgspec.DecodeError) as exc:
+            # A corrupt frame leaves the stream unreadable, just like a broken socket
+            error = self._error_for(exc)
+            pending._error = error
+            pending._done = True
+            self._abort(error)
+            return
+
+        try:
+            pending._value = _unwrap_response(self._client._name, pending._endpoint, response)
+        except RemoteExecutionError as exc:
+            pending._error = exc
+        pending._done = True
+        if _is_rejection(response):
+            # The server answers nothing more on this connection: fail the rest
+            # with the same error and keep the socket out of the pool
+            assert pending._error is not None
+            self._abort(pending._error)
+
+    @staticmethod
+    def _error_for(exc: BaseException) -> RemoteExecutionError:
+        if isinstance(exc, RemoteExecutionError):
+            return exc
+        return RemoteExecutionError(f"Request failed: {exc}")
+
+    def _abort(self, error: RemoteExecutionError) -> None:
+        """Fail every outstanding call and drop the (now unusable) socket."""
+        self._abort_error = error
+        while self._pending:
+            pending = self._pending.popleft()
+            pending._error = error
+            pending._done = True
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+            self._reader = None
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        sock = self._sock
+        if sock is None:
+            return
+        if exc_type is not None:
+            # Unread responses would desynchronise the socket; discard it.
+            self._abort(RemoteExecutionError("Pipeline aborted before its responses were read"))
+            return
+        self.drain()
+        if self._sock is not None:
+            self._sock = self._reader = None
+            self._client._return_socket(sock)
 
 
 class ServiceClient:
@@ -24,51 +425,174 @@ class ServiceClient:
         timeout: float = 5.0,
         poll_interval: float = 0.002,
         max_pool_size: int = 16,
+        min_pool_size: int = 1,
+        idle_timeout: float = 60.0,
+        socket_buf_size: int = _DEFAULT_SOCKET_BUFFER_SIZE,
         **ctor_kwargs: Any,
     ) -> None:
+        self._method_cache: Dict[str, Callable[..., Any]] = {}
         self._name = name
         self._timeout = timeout
         self._poll_interval = poll_interval
         self._ctor_args = list(ctor_args)
         self._ctor_kwargs = dict(ctor_kwargs)
+        # Constant for the client's lifetime: encode once, splice into every call
+        self._ctor_args_raw = preencode(self._ctor_args)
+        self._ctor_kwargs_raw = preencode(self._ctor_kwargs)
         self._closed = False
         self._max_pool_size = max_pool_size
+        self._min_pool_size = min_pool_size
+        # Pooled sockets unused for longer than this are closed instead of reused
+        self._idle_timeout = idle_timeout
+        self._socket_buf_size = socket_buf_size
+        self._buffer_size_checked = False
 
         # Get service connection info
-        service_info = resolve_service(name)
-        self._host = service_info.host
-        self._port = service_info.port
+        self._apply_service_info(_resolve_cached(name))
 
-        # Connection pooling for better performance and thread-safety
-        self._socket_pool: Queue[socket.socket] = Queue(maxsize=self._max_pool_size)
+        # Connection pooling: each thread owns its own small pool, so the hot
+        # path never coordinates with other threads sharing this client.
+        self._local = threading.local()
+        self._pools: WeakValueDictionary[int, Deque[_PooledSocket]] = WeakValueDictionary()
+        self._pools_lock = threading.Lock()
 
-        # Cache endpoints
-        self._endpoints: List[str] = self._fetch_endpoints()
+        # Pre-connect sockets so the first calls don't pay for the handshake.
+        for _ in range(min(min_pool_size, max_pool_size)):
+            self._return_socket(self._connect())
+
+        # The endpoint list is only fetched when asked for; stubs are compiled per
+        # name on first access, so connecting costs no extra round-trip.
+        self._endpoints: Optional[List[str]] = None
+
+    def _apply_service_info(self, service_info: ServiceRecord) -> None:
+        self._host = service_info.host
+        self._port = service_info.port
+        self._unix_path = service_info.unix_path if hasattr(socket, "AF_UNIX") else None
+        self._quickack = _TCP_QUICKACK is not None and not self._unix_path
+
+    def _bind_endpoint(self, endpoint: str, method: Callable[..., Any]) -> None:
+        """
+        Store ``method`` as an instance attribute named ``endpoint``.
+
+        ``client.get`` then resolves through the normal instance-dict lookup
+        and never reaches ``__getattr__``. Names that would shadow a client
+        attribute or method (``close``, ``_name``, ...) stay reachable only
+        through ``__getattr__``, as before.
+        """
+        if endpoint.startswith("_") or endpoint in self.__dict__ or hasattr(type(self), endpoint):
+            return
+        self.__dict__[endpoint] = method
+
+    def _thread_pool(self) -> Deque[_PooledSocket]:
+        """Return the calling thread's socket pool, creating it on first use."""
+        pool = getattr(self._local, "pool", None)
+        if pool is None:
+            pool = deque()
+            self._local.pool = pool
+            # Registered weakly so pools of finished threads are dropped with them.
+            with self._pools_lock:
+                self._pools[threading.get_ident()] = pool
+        return pool
 
     def _get_socket(self) -> socket.socket:
-        """Get a socket from the pool or create a new one."""
-        if not self._socket_pool.empty():
+        """
+        Get a socket from the pool or create a new one.
+
+        The pool is a stack: the most recently returned socket is handed out
+        first, so the hot connection stays hot while the others sit at the
+        bottom of the deque and age out.
+        """
+        # deque.pop is atomic under the GIL, so the hit path takes no lock at all;
+        # a missing pool (first use on this thread) or an empty one both fall through.
+        try:
+            sock, last_used = self._local.pool.pop()
+        except (AttributeError, IndexError):
+            self._thread_pool()
+            return self._connect()
+
+        if time.monotonic() - last_used <= self._idle_timeout:
+            return sock
+
+        # The peer may have dropped an idle connection; with LIFO ordering
+        # everything still in the pool is older, so discard it all.
+        sock.close()
+        pool = self._local.pool
+        while True:
+            try:
+                stale, _ = pool.pop()
+            except IndexError:
+                break
+            stale.close()
+        return self._connect()
+
+    def _connect(self) -> socket.socket:
+        """Open a new connection to the service."""
+        try:
+            return self._open_socket()
+        except OSError:
+            # The cached registry record may predate a restart of the service
+            address = (self._host, self._port, self._unix_path)
+            self._apply_service_info(_resolve_cached(self._name, refresh=True))
+            if (self._host, self._port, self._unix_path) == address:
+                raise
+            return self._open_socket()
+
+    def _open_socket(self) -> socket.socket:
+        if self._unix_path:
+            # Same-host service: a UNIX-domain socket bypasses the TCP/IP stack
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
             try:
-                return self._socket_pool.get_nowait()
-            except Exception:
-                pass  # Fallback to creating a new socket
+                self._apply_buffer_sizes(sock)
+                sock.settimeout(self._timeout)
+                sock.connect(self._unix_path)
+                return sock
+            except OSError:
+                # Unreachable from here (another network namespace, a removed
+                # socket file, ...): stay on TCP for the rest of this client.
+                sock.close()
+                self._unix_path = None
+                self._quickack = _TCP_QUICKACK is not None
 
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # Disable Nagle's algorithm
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)  # Enable keepalive
+        if self._quickack:
+            sock.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)  # Disable delayed ACKs
+        self._apply_buffer_sizes(sock)
         sock.settimeout(self._timeout)
         sock.connect((self._host, self._port))
         return sock
 
+    def _apply_buffer_sizes(self, sock: socket.socket) -> None:
+        _set_buffer_sizes(sock, self._socket_buf_size)
+        # The kernel limit doesn't change per socket: check (and warn) only once
+        if not self._buffer_size_checked:
+            self._buffer_size_checked = True
+            if _buffer_sizes_clamped(sock, self._socket_buf_size):
+                get_logger("metabridge.client").warning(
+                    f"Socket buffers for '{self._name}' were capped below the requested "
+                    f"{self._socket_buf_size} bytes; raise net.core.rmem_max/wmem_max to allow it."
+                )
+
     def _return_socket(self, sock: socket.socket) -> None:
-        """Return a socket to the pool if it's not full."""
+        """Push a socket back on top of the pool (LIFO) if it's not full."""
         if self._closed:
             sock.close()
             return
-        try:
-            self._socket_pool.put_nowait(sock)
-        except Full:
+        pool = self._thread_pool()
+        if len(pool) >= self._max_pool_size:
             sock.close()
+            return
+
+        now = time.monotonic()
+        pool.append((sock, now))
+        # Lazy sweep: the oldest sockets sit at the left end of the stack.
+        while len(pool) > self._min_pool_size and now - pool[0][1] > self._idle_timeout:
+            try:
+                stale, _ = pool.popleft()
+            except IndexError:
+                break
+            stale.close()
 
     @contextmanager
     def _managed_socket(self) -> Generator[socket.socket, None, None]:
@@ -86,83 +610,150 @@ class ServiceClient:
             sock.close()
             raise
 
-    def _send_request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def _send_request(self, payload: Request) -> Response:
         """Send request and receive response using a managed socket."""
         try:
             with self._managed_socket() as sock:
-                # Serialize with msgpack (faster and safer than pickle)
-                data = msgpack.packb(payload, use_bin_type=True)
-
-                # Send length header (4 bytes) + data
-                sock.sendall(struct.pack("!I", len(data)) + data)
-
-                # Receive response length
-                length_bytes = sock.recv(4)
-                if not length_bytes:
-                    raise RemoteExecutionError("Connection closed by server")
-
-                response_length = struct.unpack("!I", length_bytes)[0]
-
-                # Receive response data
-                response_data = b""
-                while len(response_data) < response_length:
-                    chunk = sock.recv(min(4096, response_length - len(response_data)))
-                    if not chunk:
-                        raise RemoteExecutionError("Connection closed while reading response")
-                    response_data += chunk
+                # Encoded straight into a reused buffer behind its length header
+                send_message(sock, payload)
+
+                response = _read_sole_response(sock)
+                if response.status != STATUS_OK and _is_rejection(response):
+                    # The server closes a connection it turns away; leaving
+                    # through an exception closes the socket instead of pooling it
+                    raise _Rejected(response)
+                if self._quickack:
+                    try:
+                        sock.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+                    except OSError:
+                        pass  # a UNIX socket pooled before falling back to TCP
+                return response
+
+        except _Rejected as rejected:
+            return rejected.response
+        except Exception as exc:
+            if isinstance(exc, RemoteExecutionError):
+                raise
+            raise RemoteExecutionError(f"Request failed: {exc}") from exc
 
-                return msgpack.unpackb(response_data, raw=False)
+    def _send_batch(self, payloads: List[CallRequest]) -> List[Response]:
+        """Send several requests over one socket, writing each window with one scatter/gather send."""
+        responses: List[Response] = []
+        encode = ENCODER.encode
+        try:
+            with self._managed_socket() as sock:
+                reader = _FrameReader(sock)
+                window: List[bytes] = []
+                window_bytes = 0
+                for index, payload in enumerate(payloads, 1):
+                    data = encode(payload)
+                    window.append(data)
+                    window_bytes += len(data)
+                    if (
+                        len(window) < _BATCH_WINDOW
+                        and window_bytes < _BATCH_WINDOW_BYTES
+                        and index < len(payloads)
+                    ):
+                        continue
+                    send_frames(sock, window)
+
+                    # The server answers in order on a connection
+                    for _ in window:
+                        response = reader.read()
+                        if _is_rejection(response):
+                            # Nothing else will be answered: raise the overload error
+                            # itself, which also keeps the socket out of the pool
+                            _unwrap_response(self._name, payloads[len(responses)].endpoint, response)
+                        responses.append(response)
+                    window = []
+                    window_bytes = 0
 
         except Exception as exc:
             if isinstance(exc, RemoteExecutionError):
                 raise
             raise RemoteExecutionError(f"Request failed: {exc}") from exc
+        return responses
 
     def _fetch_endpoints(self) -> List[str]:
-        response = self._send_request({"type": "list_endpoints"})
-        if response.get("status") != "ok":
+        response = self._send_request(ListEndpointsRequest())
+        if response.status != STATUS_OK:
             raise RemoteExecutionError(f"Unable to query endpoints: {response}")
-        return list(response.get("result", []))
+        return list(response.result or [])
 
     def __getattr__(self, name: str) -> Callable[..., Any]:
-        def call_remote(*args: Any, **kwargs: Any) -> Any:
-            payload = {
-                "type": "call",
-                "endpoint": name,
-                "args": args,
-                "kwargs": kwargs,
-                "ctor_args": self._ctor_args,
-                "ctor_kwargs": self._ctor_kwargs,
-            }
-
-            response = self._send_request(payload)
-
-            if response.get("status") == "ok":
-                return response.get("result")
-
-            error = response.get("error", {})
-            raise RemoteExecutionError(
-                f"Remote call to '{self._name}.{name}' failed:\n"
-                f"  Type: {error.get('type')}\n"
-                f"  Message: {error.get('message')}"
-            )
-
-        return call_remote
+        method = self._method_cache.get(name)
+        if method is None:
+            # First access to this endpoint: compile its stub and bind it, so
+            # this slow path runs only once per name.
+            method = self._method_cache.setdefault(name, _compile_stubs(self, [name])[name])
+            self._bind_endpoint(name, method)
+        return method
+
+    def get_many(self, endpoint: str, arg_list: Iterable[Sequence[Any]]) -> List[Any]:
+        """
+        Call ``endpoint`` once per argument sequence and return the results in order.
+
+        All requests share one socket and are written in batches before their
+        responses are read, so N calls cost a handful of syscalls instead of 2N.
+        If any call fails, the first error is raised once the batch is drained.
+        """
+        return self.call_many(endpoint, ((args, {}) for args in arg_list))
+
+    def call_many(
+        self,
+        endpoint: str,
+        calls: Iterable[Tuple[Sequence[Any], Dict[str, Any]]],
+    ) -> List[Any]:
+        """
+        Call ``endpoint`` once per ``(args, kwargs)`` pair and return the results in order.
+
+        Like ``get_many``, but each call may also pass keyword arguments.
+        """
+        ctor_args, ctor_kwargs = self._ctor_args_raw, self._ctor_kwargs_raw
+        payloads = [
+            CallRequest(endpoint, tuple(args), kwargs, ctor_args, ctor_kwargs)
+            for args, kwargs in calls
+        ]
+        responses = self._send_batch(payloads)
+        return [_unwrap_response(self._name, endpoint, response) for response in responses]
+
+    def pipeline(self, depth: int = 32) -> _Pipeline:
+        """
+        Return a context manager that keeps up to ``depth`` calls in flight.
+
+        ``pipe.call(endpoint, *args, **kwargs)`` sends immediately and returns
+        a ``PipelinedCall``; its ``result()`` reads queued responses in order.
+        All outstanding responses are read when the block exits.
+        """
+        return _Pipeline(self, depth)
 
     def endpoints(self) -> List[str]:
+        if self._endpoints is None:
+            self._endpoints = self._fetch_endpoints()
         return list(self._endpoints)
 
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Return the server's instance-cache counters, keyed by endpoint name."""
+        response = self._send_request(CacheStatsRequest())
+        if response.status != STATUS_OK:
+            raise RemoteExecutionError(f"Unable to query cache stats: {response}")
+        return dict(response.result or {})
+
     def close(self) -> None:
         """Close the client and all pooled socket connections."""
         if self._closed:
             return
         self._closed = True
-        while not self._socket_pool.empty():
-            try:
-                sock = self._socket_pool.get_nowait()
-                sock.close()
-            except Exception:
-                pass
+        with self._pools_lock:
+            pools = list(self._pools.values())
+        for pool in pools:
+            while True:
+                try:
+                    sock, _ = pool.pop()
+                except IndexError:
+                    break
+                with suppress(OSError):
+                    sock.close()
 
     def __enter__(self) -> "ServiceClient":
         return self
@@ -171,6 +762,133 @@ class ServiceClient:
         self.close()
 
 
+class AsyncServiceClient:
+    """
+    asyncio client that pipelines calls over a single persistent connection.
+
+    Every call is written as soon as it is made, without waiting for earlier
+    replies. The server answers requests in order on a connection, so a single
+    reader task resolves the pending futures first-in, first-out.
+    """
+
+    def __init__(self, name: str, *ctor_args: Any, timeout: float = 5.0, **ctor_kwargs: Any) -> None:
+        self._name = name
+        self._timeout = timeout
+        self._ctor_args_raw = preencode(list(ctor_args))
+        self._ctor_kwargs_raw = preencode(dict(ctor_kwargs))
+        self._service_info = _resolve_cached(name)
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task[None] | None = None
+        self._pending: Deque[asyncio.Future[Response]] = deque()
+        self._methods: Dict[str, Callable[..., Awaitable[Any]]] = {}
+
+    async def connect(self) -> "AsyncServiceClient":
+        """Open the connection and start the response reader task."""
+        if self._writer is not None:
+            return self
+        try:
+            self._reader, self._writer = await self._open_connection()
+        except OSError:
+            # The cached registry record may predate a restart of the service
+            stale = self._service_info
+            self._service_info = _resolve_cached(self._name, refresh=True)
+            if self._service_info == stale:
+                raise
+            self._reader, self._writer = await self._open_connection()
+
+        sock = self._writer.get_extra_info("socket")
+        if sock is not None and sock.family == socket.AF_INET:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        self._reader_task = asyncio.get_running_loop().create_task(self._read_responses())
+        return self
+
+    async def _open_connection(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        info = self._service_info
+        if info.unix_path and hasattr(socket, "AF_UNIX"):
+            connecting = asyncio.open_unix_connection(info.unix_path)
+        else:
+            connecting = asyncio.open_connection(info.host, info.port)
+        return await asyncio.wait_for(connecting, self._timeout)
+
+    async def _read_responses(self) -> None:
+        assert self._reader is not None
+        try:
+            while True:
+                length_bytes = await self._reader.readexactly(4)
+                # An exact 4-byte header: from_bytes skips unpack()'s result tuple
+                response_length = int.from_bytes(length_bytes, "big")
+                response = RESPONSE_DECODER.decode(await self._reader.readexactly(response_length))
+                future = self._pending.popleft()
+                # A caller that timed out leaves its future in place to keep the order
+                if not future.done():
+                    future.set_result(response)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            error = RemoteExecutionError(f"Connection to '{self._name}' lost: {exc}")
+            while self._pending:
+                future = self._pending.popleft()
+                if not future.done():
+                    future.set_exception(error)
+
+    async def call(self, endpoint: str, *args: Any, **kwargs: Any) -> Any:
+        """Invoke ``endpoint`` remotely and await its result."""
+        if self._writer is None:
+            await self.connect()
+        assert self._writer is not None and self._reader_task is not None
+        if self._reader_task.done():
+            raise RemoteExecutionError(f"Connection to '{self._name}' is closed")
+
+        payload = CallRequest(endpoint, args, kwargs, self._ctor_args_raw, self._ctor_kwargs_raw)
+        # Encode behind a reserved header so the frame goes out in a single write:
+        # two writes would put the header in its own syscall (and TCP segment).
+        frame = bytearray(4)
+        ENCODER.encode_into(payload, frame, 4)
+        LENGTH_PREFIX.pack_into(frame, 0, len(frame) - 4)
+
+        future: asyncio.Future[Response] = asyncio.get_running_loop().create_future()
+        self._pending.append(future)
+        self._writer.write(frame)
+        await self._writer.drain()
+
+        response = await asyncio.wait_for(future, self._timeout)
+        return _unwrap_response(self._name, endpoint, response)
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        method = self._methods.get(name)
+        if method is None:
+            method = functools.partial(self.call, name)
+            self._methods[name] = method
+        return method
+
+    async def close(self) -> None:
+        """Stop the reader task and close the connection."""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+            self._writer = None
+
+    async def __aenter__(self) -> "AsyncServiceClient":
+        return await self.connect()
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.close()
+
+
 def connect_service(
     name: str,
     *ctor_args: Any,
@@ -2,4 +2,12 @@
 """Centralized configuration for MetaBridge."""
 from __future__ import annotations
 
-DEFAULT_HOST = "127.0.0.1"
\ No newline at end of file
+import os
+
+DEFAULT_HOST = "127.0.0.1"
+
+# File holding the records of every running service of this user; point
+# META_REGISTRY elsewhere to keep a set of services (e.g. a test run) apart.
+REGISTRY_PATH = os.environ.get("META_REGISTRY") or os.path.join(
+    os.path.expanduser("~"), ".metabridge", "registry.msgpack"
+)
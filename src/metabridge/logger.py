@@ -1,24 +1,33 @@
 # src/metabridge/logger.py
 import logging
+import os
 import sys
-from functools import lru_cache
-from typing import Optional
+from typing import Dict, Optional
 
 from rich.console import Console
 from rich.logging import RichHandler
 
 _console = Console(file=sys.stderr)
 
+# Capturar variáveis locais em cada frame é caro: só com METABRIDGE_DEBUG=1.
+_SHOW_LOCALS = os.environ.get("METABRIDGE_DEBUG", "") not in ("", "0")
+
+_LOGGERS: Dict[Optional[str], logging.Logger] = {}
+
 
-@lru_cache()
 def get_logger(name: Optional[str] = "metabridge") -> logging.Logger:
     """
     Configura e retorna um logger com formatação rich.
 
     Armazena em cache a instância do logger para evitar reconfiguração.
     """
+    logger = _LOGGERS.get(name)
+    if logger is not None:
+        return logger
+
     logger = logging.getLogger(name)
     if logger.hasHandlers():
+        _LOGGERS[name] = logger
         return logger
 
     handler = RichHandler(
@@ -28,11 +37,12 @@ def get_logger(name: Optional[str] = "metabridge") -> logging.Logger:
         show_path=False,
         markup=True,
         rich_tracebacks=True,
-        tracebacks_show_locals=True,  # Mostra variáveis locais em tracebacks
+        tracebacks_show_locals=_SHOW_LOCALS,  # Variáveis locais em tracebacks (debug)
     )
 
     logger.addHandler(handler)
     logger.setLevel(logging.INFO)
     logger.propagate = False  # Previne logs duplicados em loggers pais
 
+    _LOGGERS[name] = logger
     return logger
\ No newline at end of file
@@ -0,0 +1,209 @@
+# src/protocol.py
+"""Wire-level message schemas shared by MetaBridge clients and servers."""
+from __future__ import annotations
+
+import os
+import socket
+import struct
+import threading
+from typing import Any, Dict, List, Sequence, Tuple, Union
+
+import msgspec
+
+
+class Request(msgspec.Struct, tag_field="type"):
+    """
+    Base of every client-to-server message.
+
+    Subclasses are tagged: the tag is written as the ``type`` key of the
+    encoded map, which is exactly how the server tells requests apart.
+    """
+
+
+class CallRequest(Request, tag="call"):
+    """
+    Envelope for a remote endpoint invocation.
+
+    ``ctor_args``/``ctor_kwargs`` never change for a client, so clients pass
+    them pre-encoded as ``msgspec.Raw`` (see ``preencode``) and the encoder
+    copies their bytes verbatim instead of walking them on every call. The
+    server decodes ``ctor_args`` as a tuple, which is already the hashable
+    form its instance cache keys on.
+    """
+
+    endpoint: str
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = {}
+    ctor_args: Union[Tuple[Any, ...], msgspec.Raw] = ()
+    ctor_kwargs: Union[Dict[str, Any], msgspec.Raw] = {}
+
+
+class ListEndpointsRequest(Request, tag="list_endpoints"):
+    """Ask the server for the names of its endpoints."""
+
+
+class CacheStatsRequest(Request, tag="cache_stats"):
+    """Ask the server for its instance-cache counters."""
+
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+# Error type of the reply sent when the server turns a connection away; the
+# connection is closed right after it, so clients must not reuse it.
+ERROR_OVERLOADED = "Overloaded"
+
+
+class Response(msgspec.Struct, array_like=True, frozen=True):
+    """
+    Envelope returned by the server for every request.
+
+    Encoded positionally as ``[status, result, error]``: ``status`` is
+    ``STATUS_OK`` or ``STATUS_ERROR`` and ``error`` is ``(type_name, message)``,
+    left empty on success.
+    """
+
+    status: int
+    result: Any = None
+    error: Tuple[str, ...] = ()
+
+
+class BinaryResult:
+    """
+    Return value for endpoints that hand back a large binary payload.
+
+    A ``BinaryResult`` returned by an endpoint is framed without being
+    serialised: the server writes the msgpack header of an ordinary
+    ``Response`` by hand and passes ``data`` to ``sendmsg`` as its own
+    buffer, so the payload is never copied in user space. Clients receive
+    plain ``bytes``, exactly as if the endpoint had returned them.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        # A flat byte view, so len() counts bytes whatever the source format
+        self.data = memoryview(data).cast("B")
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return f"BinaryResult(<{len(self.data)} bytes>)"
+
+
+def _enc_hook(value: Any) -> Any:
+    # A BinaryResult nested inside another value is simply encoded as bytes
+    if isinstance(value, BinaryResult):
+        return value.data
+    raise NotImplementedError(f"Objects of type {type(value)!r} are not supported")
+
+
+# Encoders/decoders are built once: msgspec keeps the schema compiled in C.
+ENCODER = msgspec.msgpack.Encoder(enc_hook=_enc_hook)
+RESPONSE_DECODER = msgspec.msgpack.Decoder(Response)
+# Typed: the ``type`` tag picks the Struct, and fields are validated and
+# materialised in C instead of going through a generic dict.
+REQUEST_DECODER = msgspec.msgpack.Decoder(
+    Union[CallRequest, ListEndpointsRequest, CacheStatsRequest]
+)
+
+
+def preencode(value: Any) -> msgspec.Raw:
+    """Encode ``value`` once so it can be embedded in later messages as-is."""
+    return msgspec.Raw(ENCODER.encode(value))
+
+
+# Every frame starts with its payload length as a 4-byte big-endian integer;
+# the precompiled Struct also unpacks straight from a memoryview without a copy.
+LENGTH_PREFIX = struct.Struct("!I")
+
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+
+
+# ``Response(STATUS_OK, <bin>)`` is ``[0, <bin>, []]``: a fixarray of three,
+# status 0, a bin header, the payload itself and an empty fixarray.
+_BINARY_RESPONSE_HEAD = b"\x93\x00"
+_EMPTY_ARRAY = b"\x90"
+
+
+def binary_response_segments(result: BinaryResult) -> Tuple[Any, ...]:
+    """Buffers that together form the encoded OK ``Response`` carrying ``result``."""
+    size = len(result.data)
+    if size < 0x100:
+        header = struct.pack("!BB", 0xC4, size)
+    elif size < 0x10000:
+        header = struct.pack("!BH", 0xC5, size)
+    else:
+        header = struct.pack("!BI", 0xC6, size)
+    return (_BINARY_RESPONSE_HEAD + header, result.data, _EMPTY_ARRAY)
+
+
+_frame_state = threading.local()
+
+
+def send_message(sock: socket.socket, value: Any) -> None:
+    """
+    Encode ``value`` and send it as one length-prefixed frame.
+
+    The message is encoded into a per-thread ``bytearray`` after 4 reserved
+    bytes and the length is packed in place, so neither the payload nor the
+    header is allocated per call and the frame leaves in a single send.
+    """
+    buffer = getattr(_frame_state, "buffer", None)
+    if buffer is None:
+        buffer = _frame_state.buffer = bytearray(4)
+    ENCODER.encode_into(value, buffer, 4)
+    LENGTH_PREFIX.pack_into(buffer, 0, len(buffer) - 4)
+    sock.sendall(buffer)
+
+
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+if _IOV_MAX <= 0:
+    _IOV_MAX = 1024
+
+
+def send_frames(sock: socket.socket, payloads: Sequence[bytes]) -> None:
+    """
+    Send every payload as its own length-prefixed frame.
+
+    Headers and payloads are handed to ``sendmsg`` as one scatter/gather list
+    (see ``send_buffers``), so the kernel assembles the frames and nothing is
+    concatenated in user space.
+    """
+    iov: List[Any] = []
+    pack = LENGTH_PREFIX.pack
+    for data in payloads:
+        iov.append(pack(len(data)))
+        iov.append(data)
+    send_buffers(sock, iov)
+
+
+def send_buffers(sock: socket.socket, buffers: List[Any]) -> None:
+    """
+    Send ``buffers`` back to back, as if they had been concatenated.
+
+    They are handed to ``sendmsg`` as a scatter/gather list chunked to
+    ``IOV_MAX`` entries; ``buffers`` may be modified while resuming.
+    """
+    if not _HAS_SENDMSG:
+        sock.sendall(b"".join(buffers))
+        return
+
+    start = 0
+    while start < len(buffers):
+        chunk = buffers[start : start + _IOV_MAX]
+        sent = sock.sendmsg(chunk)
+        # Skip the buffers that went out whole and resume inside a partial one.
+        for index, buf in enumerate(chunk):
+            size = len(buf)
+            if sent < size:
+                buffers[start + index] = memoryview(buf)[sent:]
+                start += index
+                break
+            sent -= size
+        else:
+            start += len(chunk)
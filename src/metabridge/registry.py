@@ -1,44 +1,32 @@
 # src/registry.py
-"""In-memory service registry using multiprocessing.Manager for IPC."""
+"""Service registry shared between processes through a small file on disk."""
 from __future__ import annotations
 
-import multiprocessing
 import os
-import socket
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass
-from multiprocessing.managers import DictProxy
-from multiprocessing.synchronize import Lock
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional, Tuple
 
-from .config import DEFAULT_HOST
-from .exceptions import ServiceAlreadyExists, ServiceNotFound
-
-# Global manager for sharing service registry across processes
-_manager: Optional[multiprocessing.managers.SyncManager] = None
-_registry: Optional[DictProxy[str, dict[str, Any]]] = None
-_lock: Optional[Lock] = None
-
-
-def _get_manager() -> multiprocessing.managers.SyncManager:
-    """Get or create the global manager."""
-    global _manager, _registry, _lock
-    if _manager is None:
-        _manager = multiprocessing.Manager()
-        _registry = _manager.dict()
-        _lock = _manager.Lock()
-    return _manager
+import msgspec
 
+from .config import REGISTRY_PATH
+from .exceptions import ServiceAlreadyExists, ServiceNotFound
 
-def _get_registry() -> DictProxy[str, dict[str, Any]]:
-    """Get the shared registry dict."""
-    _get_manager()
-    return _registry  # type: ignore[return-value]
-
+try:
+    import fcntl
+except ImportError:  # Windows: writers only serialize within one process
+    fcntl = None  # type: ignore[assignment]
 
-def _get_lock() -> Lock:
-    """Get the shared lock."""
-    _get_manager()
-    return _lock  # type: ignore[return-value]
+# Writers take an exclusive flock on a sibling lock file (the registry itself
+# is replaced on every write, so it cannot carry the lock). Readers take no
+# lock: replacement is an atomic rename, so they see the old file or the new.
+_LOCK_PATH = REGISTRY_PATH + ".lock"
+# flock already excludes other threads (each holds its own open file), but
+# the thread lock keeps that true where fcntl is unavailable.
+_write_lock = threading.Lock()
 
 
 @dataclass
@@ -49,13 +37,26 @@ class ServiceRecord:
     host: str
     port: int
     pid: int
+    unix_path: Optional[str] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ServiceRecord":
-        return cls(name=data["name"], host=data["host"], port=data["port"], pid=int(data["pid"]))
+        return cls(
+            name=data["name"],
+            host=data["host"],
+            port=data["port"],
+            pid=int(data["pid"]),
+            unix_path=data.get("unix_path"),
+        )
 
     def to_dict(self) -> Dict[str, Any]:
-        return {"name": self.name, "host": self.host, "port": self.port, "pid": self.pid}
+        return {
+            "name": self.name,
+            "host": self.host,
+            "port": self.port,
+            "pid": self.pid,
+            "unix_path": self.unix_path,
+        }
 
 
 def _is_process_alive(pid: int) -> bool:
@@ -73,62 +74,139 @@ def _is_process_alive(pid: int) -> bool:
     return True
 
 
-def register_service(record: ServiceRecord) -> None:
-    """Register a service in the shared registry."""
-    registry = _get_registry()
-    lock = _get_lock()
-
-    with lock:
-        if record.name in registry:
-            existing_data = registry[record.name]
-            existing_pid = existing_data.get("pid", -1)
-
-            if existing_pid != record.pid and _is_process_alive(existing_pid):
-                raise ServiceAlreadyExists(f"Service '{record.name}' is already registered by pid {existing_pid}.")
+_DECODER = msgspec.msgpack.Decoder(Dict[str, ServiceRecord])
+_ENCODER = msgspec.msgpack.Encoder()
 
-        registry[record.name] = record.to_dict()
+# Last registry contents read, with the identity of the file they came from;
+# while the file is unchanged a lookup costs one fstat() instead of a read and
+# a decode. One tuple, so threads swap stamp and records together.
+_cache: Tuple[Optional[Tuple[int, int, int]], Dict[str, ServiceRecord]] = (None, {})
 
 
-def unregister_service(name: str, *, expected_pid: Optional[int] = None) -> None:
-    """Remove a service from the registry."""
-    registry = _get_registry()
-    lock = _get_lock()
-
-    with lock:
-        if name not in registry:
-            return
-
-        if expected_pid is not None:
-            existing = registry.get(name, {})
-            if existing.get("pid") != expected_pid:
-                return
+def _stamp(stat: os.stat_result) -> Tuple[int, int, int]:
+    # Every write renames a new file into place, which changes the inode;
+    # mtime and size guard against the freed inode number being reused.
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
 
-        del registry[name]
 
+def _read_records() -> Dict[str, ServiceRecord]:
+    """Current registry contents, re-read only if the file has changed."""
+    global _cache
+    try:
+        with open(REGISTRY_PATH, "rb") as registry_file:
+            stamp = _stamp(os.fstat(registry_file.fileno()))
+            cached_stamp, cached_records = _cache
+            if stamp == cached_stamp:
+                return cached_records
+            data = registry_file.read()
+    except FileNotFoundError:
+        return {}
+    try:
+        records = _DECODER.decode(data)
+    except (msgspec.DecodeError, msgspec.ValidationError):
+        records = {}  # Unreadable: treated as empty and rewritten on next change
+    _cache = (stamp, records)
+    return records
 
-def resolve_service(name: str) -> ServiceRecord:
-    """Find a service in the registry."""
-    registry = _get_registry()
-    lock = _get_lock()
 
-    with lock:
-        if name not in registry:
-            raise ServiceNotFound(f"Service '{name}' was not found.")
+def _write_records(records: Dict[str, ServiceRecord]) -> None:
+    """Atomically replace the registry file; the caller holds ``_locked()``."""
+    directory = os.path.dirname(REGISTRY_PATH)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".registry-")
+    try:
+        with os.fdopen(fd, "wb") as temp_file:
+            temp_file.write(_ENCODER.encode(records))
+        os.replace(temp_path, REGISTRY_PATH)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+@contextmanager
+def _locked() -> Iterator[Dict[str, ServiceRecord]]:
+    """Hold the registry write lock and yield a mutable copy of its records."""
+    directory = os.path.dirname(REGISTRY_PATH)
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    with _write_lock:
+        lock_fd = os.open(_LOCK_PATH, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            yield dict(_read_records())
+        finally:
+            os.close(lock_fd)  # Also releases the flock
+
+
+# Liveness answers reused by lookups for a short while: a client resolving
+# before every call then costs no kill() syscall per lookup. Registration
+# always asks the kernel, so a fast restart never sees a dead owner as alive.
+_ALIVE_TTL = 1.0
+_ALIVE_CACHE_LIMIT = 1024
+_alive_cache: Dict[int, Tuple[float, bool]] = {}
+
+
+def _is_process_alive_cached(pid: int) -> bool:
+    now = time.monotonic()
+    entry = _alive_cache.get(pid)
+    if entry is not None and now - entry[0] < _ALIVE_TTL:
+        return entry[1]
+    alive = _is_process_alive(pid)
+    if len(_alive_cache) >= _ALIVE_CACHE_LIMIT:
+        _alive_cache.clear()
+    _alive_cache[pid] = (now, alive)
+    return alive
 
-        data = registry[name]
-        record = ServiceRecord.from_dict(data)
 
-        if not _is_process_alive(record.pid):
-            del registry[name]
-            raise ServiceNotFound(f"Service '{name}' appears to be stale (process {record.pid} is not running).")
+def register_service(record: ServiceRecord) -> None:
+    """Register a service in the shared registry."""
+    with _locked() as records:
+        existing = records.get(record.name)
+        if existing is not None:
+            if existing == record:
+                return  # Re-published unchanged: nothing to write
+            if existing.pid != record.pid and _is_process_alive(existing.pid):
+                raise ServiceAlreadyExists(
+                    f"Service '{record.name}' is already registered by pid {existing.pid}."
+                )
+
+        records[record.name] = record
+        _write_records(records)
+
+
+def unregister_service(
+    name: str, *, expected_pid: Optional[int] = None, expected_port: Optional[int] = None
+) -> None:
+    """Remove a service from the registry, optionally only if it is still the given record."""
+    if name not in _read_records():
+        return  # Nothing to remove: skip the lock and the rewrite
+
+    with _locked() as records:
+        existing = records.get(name)
+        if existing is None:
+            return
+        if expected_pid is not None and existing.pid != expected_pid:
+            return
+        if expected_port is not None and existing.port != expected_port:
+            return
 
-        return record
+        del records[name]
+        _write_records(records)
 
 
-def find_free_port(host: str = DEFAULT_HOST) -> int:
-    """Find an available TCP port on the given host."""
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.bind((host, 0))
-        s.listen(1)
-        port = s.getsockname()[1]
-        return port
\ No newline at end of file
+def resolve_service(name: str) -> ServiceRecord:
+    """Find a service in the registry."""
+    record = _read_records().get(name)
+    if record is None:
+        raise ServiceNotFound(f"Service '{name}' was not found.")
+
+    if not _is_process_alive_cached(record.pid):
+        # Drop the stale record unless its owner has been replaced meanwhile
+        unregister_service(name, expected_pid=record.pid, expected_port=record.port)
+        raise ServiceNotFound(
+            f"Service '{name}' appears to be stale (process {record.pid} is not running)."
+        )
+
+    return record
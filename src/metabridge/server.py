@@ -4,39 +4,90 @@ from __future__ import annotations
 
 import asyncio
 import atexit
-import functools
+import gc
+import heapq
+import inspect
+import itertools
+import logging
 import multiprocessing
 import os
+import queue
+import reprlib
+import select
+import selectors
 import socket
-import struct
+import sys
+import tempfile
 import threading
 import time
-from collections import OrderedDict
-from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 from multiprocessing.context import BaseContext
 from types import MappingProxyType
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+from weakref import WeakKeyDictionary, WeakSet
 
-import msgpack
+import msgspec
 
 from .config import DEFAULT_HOST
 from .exceptions import MetaBridgeError, ServiceNotFound
 from .logger import get_logger
+from .protocol import (
+    ENCODER,
+    ERROR_OVERLOADED,
+    LENGTH_PREFIX,
+    REQUEST_DECODER,
+    STATUS_ERROR,
+    STATUS_OK,
+    BinaryResult,
+    CacheStatsRequest,
+    CallRequest,
+    ListEndpointsRequest,
+    Request,
+    Response,
+    binary_response_segments,
+    send_buffers,
+)
 from .registry import (
     ServiceRecord,
-    find_free_port,
     register_service,
     resolve_service,
     unregister_service,
 )
 
-JsonDict = Dict[str, Any]
 EndpointSpec = Tuple[str, Callable[..., Any]]
 CallableFactory = Callable[[List[Any], Dict[str, Any]], Callable[..., Any]]
 
+
+class _EndpointMeta:
+    """Metadata the ``metabridge`` decorators record for an endpoint function."""
+
+    __slots__ = ("endpoint", "owner", "attr", "descriptor")
+
+    def __init__(
+        self,
+        endpoint: str,
+        owner: Optional[type] = None,
+        attr: str = "",
+        descriptor: str = "instance",
+    ) -> None:
+        self.endpoint = endpoint
+        self.owner = owner
+        self.attr = attr
+        self.descriptor = descriptor
+
+
+# Sidecar table instead of attributes on the functions themselves; weak keys let
+# decorated functions be collected along with their metadata.
+_ENDPOINT_META: "WeakKeyDictionary[Callable[..., Any], _EndpointMeta]" = WeakKeyDictionary()
+
 _ACTIVE_DAEMONS: List["DaemonHandle"] = []
 _DAEMON_CLEANUP_REGISTERED = False
 
+# Records published by this process, withdrawn from the registry at exit by a
+# single atexit hook however many services come and go.
+_PUBLISHED_SERVICES: List[ServiceRecord] = []
+_PUBLISHED_CLEANUP_REGISTERED = False
+
 
 def _compute_worker_count() -> int:
     workers_env = os.environ.get("META_WORKERS")
@@ -50,6 +101,47 @@ def _compute_worker_count() -> int:
     return workers
 
 
+def _compute_queue_limit(workers: int) -> int:
+    """Connections allowed to wait for a worker before new ones are turned away."""
+    queue_env = os.environ.get("META_QUEUE")
+    try:
+        limit = int(queue_env) if queue_env else 0
+    except (ValueError, TypeError):
+        limit = 0
+    return limit if limit > 0 else workers * 8
+
+
+def _compute_listener_count() -> int:
+    """Number of TCP listeners sharing the service port via SO_REUSEPORT."""
+    if not hasattr(socket, "SO_REUSEPORT"):
+        return 1
+    listeners_env = os.environ.get("META_LISTENERS")
+    try:
+        listeners = int(listeners_env) if listeners_env else 1
+    except (ValueError, TypeError):
+        listeners = 1
+    return max(1, listeners)
+
+
+def _listen_backlog() -> int:
+    """Accept-queue length: the kernel's configured maximum, not a fixed 128."""
+    try:
+        # socket.SOMAXCONN is a compile-time constant; Linux is often tuned higher
+        with open("/proc/sys/net/core/somaxconn") as somaxconn:
+            return max(int(somaxconn.read()), socket.SOMAXCONN)
+    except (OSError, ValueError):
+        return socket.SOMAXCONN
+
+
+def _unix_socket_path(name: str) -> str:
+    """Return the UNIX-domain socket address used by this process for ``name``."""
+    filename = f"metabridge-{name}-{os.getpid()}.sock"
+    if sys.platform.startswith("linux"):
+        # Abstract namespace: nothing on disk to clean up if the daemon is killed.
+        return "\0" + filename
+    return os.path.join(tempfile.gettempdir(), filename)
+
+
 def _register_daemon_handle(handle: "DaemonHandle") -> None:
     global _DAEMON_CLEANUP_REGISTERED
     _ACTIVE_DAEMONS.append(handle)
@@ -73,6 +165,32 @@ def _shutdown_daemons() -> None:
             pass
 
 
+def _track_published(record: ServiceRecord) -> None:
+    global _PUBLISHED_CLEANUP_REGISTERED
+    _PUBLISHED_SERVICES.append(record)
+    if not _PUBLISHED_CLEANUP_REGISTERED:
+        atexit.register(_unregister_published)
+        _PUBLISHED_CLEANUP_REGISTERED = True
+
+
+def _untrack_published(record: ServiceRecord) -> None:
+    try:
+        _PUBLISHED_SERVICES.remove(record)
+    except ValueError:
+        pass
+
+
+def _unregister_published() -> None:
+    for record in list(_PUBLISHED_SERVICES):
+        try:
+            # The pid/port checks spare records since taken over by another server
+            unregister_service(
+                record.name, expected_pid=record.pid, expected_port=record.port
+            )
+        except Exception:
+            pass
+
+
 class _FunctionFactory:
     def __init__(self, func: Callable[..., Any]) -> None:
         self._func = func
@@ -83,50 +201,336 @@ class _FunctionFactory:
         return self._func
 
 
-class _InstanceMethodFactory:
+# Bytes a connection asks the kernel for per read; the buffer only grows past
+# this for larger frames, and is shrunk again above the limit once drained.
+_READ_SIZE = 64 * 1024
+_RECV_BUFFER_LIMIT = 1024 * 1024
+# Pipelined responses sent together at most, so the first ones are not held back.
+_MAX_BATCHED_REPLIES = 64
+# Kernel socket buffers requested for TCP connections, so bursts of pipelined
+# calls are absorbed without stalling the sender. Set on the listener: accepted
+# sockets inherit them without an extra syscall each.
+_SOCKET_BUFFER_SIZE = 1024 * 1024
+
+
+# A connection that stays quiet this long hands its worker back to the pool and
+# waits in the reactor; one that keeps a worker busy yields it after a time slice
+# whenever other connections are waiting for one.
+_IDLE_HANDOFF = 0.005
+_TIME_SLICE = 0.01
+
+_TCP_QUICKACK = getattr(socket, "TCP_QUICKACK", None)
+
+_HAS_POLL = hasattr(select, "poll")
+
+
+def _wait_readable(sock: socket.socket, timeout: float) -> bool:
+    """Wait up to ``timeout`` seconds for ``sock`` to become readable."""
+    if _HAS_POLL:
+        poller = select.poll()
+        poller.register(sock, select.POLLIN)
+        return bool(poller.poll(timeout * 1000))
+    readable, _, _ = select.select([sock], [], [], timeout)
+    return bool(readable)
+
+
+# Replies that do not fit in the socket buffer are finished by the reactor
+# instead of blocking a worker; without non-blocking sendmsg they go out blocking.
+_MSG_DONTWAIT = getattr(socket, "MSG_DONTWAIT", 0)
+_DEFER_WRITES = bool(_MSG_DONTWAIT) and hasattr(socket.socket, "sendmsg")
+
+
+# Sent as the reply to a request that found every worker backed up.
+_OVERLOADED_PAYLOAD = ENCODER.encode(
+    Response(STATUS_ERROR, error=(ERROR_OVERLOADED, "Service is overloaded, try again later"))
+)
+_OVERLOADED_REPLY = LENGTH_PREFIX.pack(len(_OVERLOADED_PAYLOAD)) + _OVERLOADED_PAYLOAD
+
+
+def _send_nowait(sock: socket.socket, buffers: List[Any]) -> int:
+    """Send as much of ``buffers`` as the socket takes without blocking."""
+    if len(buffers) == 1:
+        return sock.send(buffers[0], _MSG_DONTWAIT)
+    return sock.sendmsg(buffers, (), _MSG_DONTWAIT)
+
+
+def _unsent(buffers: List[Any], sent: int) -> List[Any]:
+    """What is left of ``buffers`` once their first ``sent`` bytes went out."""
+    rest: List[Any] = []
+    for buf in buffers:
+        size = len(buf)
+        if sent >= size:
+            sent -= size
+            continue
+        view = memoryview(buf)[sent:]
+        sent = 0
+        # A bytearray is a worker's reply buffer, reused as soon as it returns
+        rest.append(bytes(view) if isinstance(buf, bytearray) else view)
+    return rest
+
+
+class _WorkerPool:
     """
-    Efficient, sharded LRU cache for service class instances to prevent lock contention.
+    Worker threads fed through a ``queue.SimpleQueue``.
+
+    Unlike ``ThreadPoolExecutor`` a job is just ``(fn, args)``: no ``Future`` is
+    built and submitting takes no lock once every thread is running. The queue
+    is unbounded; servers bound it themselves (see ``ServiceServer._dispatch``).
+    """
+
+    def __init__(self, workers: int, name: str) -> None:
+        self._workers = workers
+        self._name = name
+        self._queue: "queue.SimpleQueue[Optional[Tuple[Callable[..., Any], Tuple[Any, ...]]]]" = (
+            queue.SimpleQueue()
+        )
+        self._threads: List[threading.Thread] = []
+        self._spawn_lock = threading.Lock()
+        # One permit per thread waiting for work, as in ThreadPoolExecutor
+        self._idle = threading.Semaphore(0)
+        self._shutdown = False
+        _WORKER_POOLS.add(self)
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> None:
+        if self._shutdown:
+            raise RuntimeError("cannot schedule new work after shutdown")
+        self._queue.put((fn, args))
+        # Threads are started on demand, only when none is idle
+        if self._idle.acquire(blocking=False) or len(self._threads) >= self._workers:
+            return
+        with self._spawn_lock:
+            if len(self._threads) < self._workers and not self._shutdown:
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"{self._name}_{len(self._threads)}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def _work(self) -> None:
+        get = self._queue.get
+        while True:
+            job = get()
+            if job is None:
+                return
+            fn, args = job
+            try:
+                fn(*args)
+            except Exception:
+                pass  # Jobs report their own errors; a worker must never die of one
+            # Drop the references before idling so the connection can be freed
+            del job, fn, args
+            self._idle.release()
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None) -> None:
+        """Stop the threads once queued jobs are done; ``timeout`` bounds the whole wait."""
+        with self._spawn_lock:
+            first = not self._shutdown
+            self._shutdown = True
+            threads = list(self._threads)
+        if first:
+            for _ in threads:
+                self._queue.put(None)
+        if wait:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            for thread in threads:
+                thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+
+
+# Live pools, stopped at exit before their threads' event loops are closed.
+_WORKER_POOLS: "WeakSet[_WorkerPool]" = WeakSet()
+# How long exit waits for busy workers before leaving their loops alone.
+_EXIT_JOIN_TIMEOUT = 1.0
+
+
+class _Connection:
+    """Per-client state that survives hand-offs between workers and the reactor."""
+
+    __slots__ = ("sock", "label", "quickack", "buffer", "start", "end", "outgoing")
+
+    def __init__(self, sock: socket.socket, label: str, *, quickack: bool = False) -> None:
+        self.sock = sock
+        self.label = label
+        # Linux clears TCP_QUICKACK as it goes, so it is re-armed after each read
+        self.quickack = quickack
+        # Receive buffer reused for every message (the decoder copies what it
+        # decodes); ``buffer[start:end]`` holds bytes not yet parsed.
+        self.buffer = bytearray(_READ_SIZE)
+        self.start = 0
+        self.end = 0
+        # Replies the socket could not take yet, written by the reactor
+        self.outgoing: Optional[List[Any]] = None
+
+
+_MISSING = object()
+
+# Global access clock for the instance caches. ``count.__next__`` is implemented
+# in C, so bumping it is atomic under the GIL and needs no lock.
+_next_ordinal = itertools.count().__next__
+
+
+class _CacheShard:
+    """One independently locked partition of an ``_InstanceCache`` probation segment."""
+
+    __slots__ = ("lock", "probation", "misses", "evictions")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # New keys wait here (FIFO) until they are requested a second time. A
+        # plain dict keeps insertion order, which is all a FIFO needs.
+        self.probation: Dict[Tuple, Any] = {}
+        self.misses = 0
+        self.evictions = 0
+
+
+class _InstanceCache:
+    """
+    Segmented (2Q-style) cache for service class instances.
+
+    A new key is admitted into a small probation FIFO and only promoted to the
+    protected segment when it is requested again, so a burst of one-off
+    constructor arguments cannot flush the instances that are actually hot.
+
+    The protected segment is one read-mostly dict: a hit is a single lockless
+    ``dict.get`` that stamps the entry with a new access ordinal. The lock is
+    only taken to change it, on promotion, and it may grow to twice its
+    capacity before the least recently stamped entries are evicted in one pass.
+    Probation churns on every miss, so it is sharded by key hash instead.
     """
 
     # Número de caches particionados. Potência de 2 para usar bitwise-AND.
     NUM_SHARDS = 16
 
-    def __init__(self, cls: type, attr_name: str, max_size: int = 128) -> None:
-        self._cls = cls
-        self._attr_name = attr_name
-        self._cache_shards: List[Callable[[Tuple], Any]] = []
-
+    def __init__(self, max_size: int = 128) -> None:
         # Distribui o tamanho máximo do cache entre os shards.
-        shard_size = max(1, max_size // self.NUM_SHARDS)
+        shard_size = max(2, max_size // self.NUM_SHARDS)
+        self._probation_size = max(1, shard_size // 4)
+        self._protected_size = max(1, max_size - self._probation_size * self.NUM_SHARDS)
+        # Shards are created on their first miss: an endpoint that only ever sees
+        # a few constructor signatures never allocates the other locks and FIFOs.
+        self._shards: Dict[int, _CacheShard] = {}
+        # Keys that proved to be reused, mapped to ``[value, last_access_ordinal]``.
+        self._protected: Dict[Tuple, List[Any]] = {}
+        self._protected_lock = threading.Lock()
+        # Bumped without a lock on the hit path, so it is approximate.
+        self._hits = 0
+        self._evictions = 0
+
+    def get_or_create(
+        self,
+        key: Tuple,
+        factory: Callable[..., Any],
+        args: List[Any],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        # Caminho rápido: um acerto no segmento protegido não adquire lock algum.
+        entry = self._protected.get(key)
+        if entry is not None:
+            entry[1] = _next_ordinal()
+            self._hits += 1
+            return entry[0]
+
+        # Seleciona um shard de forma rápida e determinística usando o hash da chave.
+        # A operação `& (NUM_SHARDS - 1)` é um truque rápido para `hash % NUM_SHARDS`.
+        index = hash(key) & (self.NUM_SHARDS - 1)
+        shard = self._shards.get(index)
+        if shard is None:
+            # setdefault is atomic: concurrent first misses agree on one shard
+            shard = self._shards.setdefault(index, _CacheShard())
+        with shard.lock:
+            value = self._lookup(shard, key)
+            if value is not _MISSING:
+                self._hits += 1
+                return value
+            shard.misses += 1
+
+        # The constructor runs outside the lock so a slow __init__ only delays its own key.
+        value = factory(*args, **kwargs)
+
+        with shard.lock:
+            existing = self._lookup(shard, key)
+            if existing is not _MISSING:
+                return existing
+            self._admit(shard, key, value)
+        return value
+
+    def _lookup(self, shard: _CacheShard, key: Tuple) -> Any:
+        """Find ``key`` in either segment; the caller must hold ``shard.lock``."""
+        entry = self._protected.get(key)
+        if entry is not None:
+            entry[1] = _next_ordinal()
+            return entry[0]
+
+        value = shard.probation.pop(key, _MISSING)
+        if value is not _MISSING:
+            # Second request: promote to the protected segment.
+            with self._protected_lock:
+                self._protected[key] = [value, _next_ordinal()]
+                if len(self._protected) > 2 * self._protected_size:
+                    self._evict_protected()
+        return value
+
+    def _evict_protected(self) -> None:
+        """Trim the protected segment back to capacity; needs ``_protected_lock``."""
+        protected = self._protected
+        excess = len(protected) - self._protected_size
+        victims = heapq.nsmallest(excess, protected.items(), key=lambda item: item[1][1])
+        for victim_key, _ in victims:
+            del protected[victim_key]
+        self._evictions += excess
+
+    def _admit(self, shard: _CacheShard, key: Tuple, value: Any) -> None:
+        shard.probation[key] = value
+        if len(shard.probation) > self._probation_size:
+            del shard.probation[next(iter(shard.probation))]
+            shard.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        totals = {"hits": self._hits, "misses": 0, "evictions": 0, "size": 0}
+        for shard in list(self._shards.values()):
+            with shard.lock:
+                totals["misses"] += shard.misses
+                totals["evictions"] += shard.evictions
+                totals["size"] += len(shard.probation)
+        with self._protected_lock:
+            totals["evictions"] += self._evictions
+            totals["size"] += len(self._protected)
+        return totals
 
-        for _ in range(self.NUM_SHARDS):
-            # Cada shard é um LRU cache independente, com seu próprio lock.
-            @functools.lru_cache(maxsize=shard_size)
-            def _create_instance_from_key(key: Tuple) -> Any:
-                """Cria uma instância a partir de uma chave combinada (args, kwargs)."""
-                ctor_args_tuple, kwargs_tuple = key
-                return self._cls(*ctor_args_tuple, **dict(kwargs_tuple))
 
-            self._cache_shards.append(_create_instance_from_key)
+class _InstanceMethodFactory:
+    """Resolves instance-method endpoints through a cache of bound service methods."""
+
+    def __init__(self, cls: type, attr_name: str, max_size: int = 128) -> None:
+        self._cls = cls
+        self._attr_name = attr_name
+        self._cache = _InstanceCache(max_size)
+        # Bound once: reading ``self._cache.get_or_create``/``self._bind`` on
+        # every call would allocate two fresh bound methods per request.
+        self._get_or_create = self._cache.get_or_create
+        self._create = self._bind
 
     def __call__(
         self, ctor_args: List[Any], ctor_kwargs: Dict[str, Any]
     ) -> Callable[..., Any]:
         # Cria uma chave única e "hasheável" para os argumentos do construtor.
-        ctor_args_tuple = tuple(ctor_args)
-        kwargs_tuple = tuple(sorted(ctor_kwargs.items()))
-        key = (ctor_args_tuple, kwargs_tuple)
+        # frozenset independe da ordem dos kwargs e dispensa a ordenação; sem kwargs
+        # (o caso comum) nem chega a ser construído.
+        kwargs_key = frozenset(ctor_kwargs.items()) if ctor_kwargs else ()
+        # Requests already decode ``ctor_args`` as a tuple, and tuple() of a
+        # tuple returns it unchanged: no copy on the hit path.
+        key = (tuple(ctor_args), kwargs_key)
 
-        # Seleciona um shard de forma rápida e determinística usando o hash da chave.
-        # A operação `& (NUM_SHARDS - 1)` é um truque rápido para `hash % NUM_SHARDS`.
-        shard_index = hash(key) & (self.NUM_SHARDS - 1)
-        create_func = self._cache_shards[shard_index]
+        # O cache guarda o método já vinculado (que mantém a instância viva), então
+        # um acerto não faz getattr nem aloca um novo bound method.
+        return self._get_or_create(key, self._create, ctor_args, ctor_kwargs)
 
-        # Obtém (ou cria) a instância a partir do shard de cache selecionado.
-        instance = create_func(key)
+    def _bind(self, *ctor_args: Any, **ctor_kwargs: Any) -> Callable[..., Any]:
+        return getattr(self._cls(*ctor_args, **ctor_kwargs), self._attr_name)
 
-        # Retorna o método solicitado da instância.
-        return getattr(instance, self._attr_name)
+    def cache_stats(self) -> Dict[str, int]:
+        return self._cache.stats()
 
 
 class _StaticLikeFactory:
@@ -140,6 +544,82 @@ class _StaticLikeFactory:
         return getattr(self._owner, self._attr_name)
 
 
+class _LogRepr(reprlib.Repr):
+    """``repr`` for log lines that stops early on large values."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.maxstring = self.maxother = 120
+
+    def repr_bytes(self, x: bytes, level: int) -> str:
+        if len(x) <= self.maxstring:
+            return repr(x)
+        return repr(x[: self.maxstring]) + "..."
+
+
+_LOG_REPR = _LogRepr()
+
+
+def _truncate(s: Any, max_len: int = 100) -> str:
+    """Truncates a string representation."""
+    s_repr = _LOG_REPR.repr(s)
+    return s_repr[:max_len] + "..." if len(s_repr) > max_len else s_repr
+
+
+_thread_state = threading.local()
+
+
+def _reply_buffer() -> bytearray:
+    """Return the calling worker thread's buffer for outgoing replies."""
+    buffer = getattr(_thread_state, "replies", None)
+    if buffer is None:
+        buffer = _thread_state.replies = bytearray(_READ_SIZE)
+    return buffer
+
+
+# Every per-thread loop handed out with its thread, closed by a single atexit hook.
+_THREAD_LOOPS: List[Tuple[threading.Thread, asyncio.AbstractEventLoop]] = []
+_LOOP_CLEANUP_REGISTERED = False
+
+
+def _thread_event_loop() -> asyncio.AbstractEventLoop:
+    """Return the calling worker thread's event loop, creating it on first use."""
+    loop = getattr(_thread_state, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _thread_state.loop = loop
+        _track_thread_loop(threading.current_thread(), loop)
+    return loop
+
+
+def _track_thread_loop(thread: threading.Thread, loop: asyncio.AbstractEventLoop) -> None:
+    global _LOOP_CLEANUP_REGISTERED
+    # Loops closed since they were handed out need no tracking any more
+    _THREAD_LOOPS[:] = [known for known in _THREAD_LOOPS if not known[1].is_closed()]
+    _THREAD_LOOPS.append((thread, loop))
+    if not _LOOP_CLEANUP_REGISTERED:
+        atexit.register(_close_thread_loops)
+        _LOOP_CLEANUP_REGISTERED = True
+
+
+def _close_thread_loops() -> None:
+    # Pool threads are daemons that nothing else joins: stop them first, then
+    # close only the loops whose thread has exited. A worker still busy after
+    # the timeout keeps its loop; the process is ending anyway.
+    for pool in list(_WORKER_POOLS):
+        pool.shutdown(wait=True, timeout=_EXIT_JOIN_TIMEOUT)
+    current = threading.current_thread()
+    for thread, loop in list(_THREAD_LOOPS):
+        if (thread.is_alive() and thread is not current) or loop.is_closed():
+            continue
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+        except Exception:
+            pass
+    _THREAD_LOOPS.clear()
+
+
 class RegisteredFunction:
     """Internal wrapper that knows how to produce a callable target."""
 
@@ -151,36 +631,75 @@ class RegisteredFunction:
     ) -> None:
         self.name = name
         self.func = func
-        self.factory = factory or (lambda *_: func)
+        self.factory = factory or _FunctionFactory(func)
+        # The call path is specialised once, at registration: sync endpoints
+        # get a plain call with no coroutine check at all. unwrap() also
+        # catches sync wrappers around ``async def`` functions.
+        if asyncio.iscoroutinefunction(inspect.unwrap(func)):
+            self.invoke = self._invoke_async
+        else:
+            self.invoke = self._invoke_sync
 
-    def invoke(
+    def _invoke_sync(
         self,
         args: List[Any],
         kwargs: Dict[str, Any],
         ctor_args: List[Any],
         ctor_kwargs: Dict[str, Any],
     ) -> Any:
-        target = self.factory(ctor_args, ctor_kwargs)
-        result = target(*args, **kwargs)
-        if asyncio.iscoroutine(result):
-            # The ThreadPoolExecutor model runs async functions in a managed event loop
-            return asyncio.run(result)
-        return result
+        return self.factory(ctor_args, ctor_kwargs)(*args, **kwargs)
+
+    def _invoke_async(
+        self,
+        args: List[Any],
+        kwargs: Dict[str, Any],
+        ctor_args: List[Any],
+        ctor_kwargs: Dict[str, Any],
+    ) -> Any:
+        # Each worker thread keeps one event loop alive across calls instead
+        # of creating and tearing one down per call like asyncio.run().
+        return _thread_event_loop().run_until_complete(
+            self.factory(ctor_args, ctor_kwargs)(*args, **kwargs)
+        )
 
 
 class ServiceServer:
     """High-performance server using TCP sockets for ultra-low latency."""
 
     def __init__(
-        self, name: str, host: Optional[str] = None, *, logger: bool = False
+        self,
+        name: str,
+        host: Optional[str] = None,
+        *,
+        logger: bool = False,
+        port: Optional[int] = None,
+        unix_socket: bool = True,
     ) -> None:
         self._name = name
         self._registry: Dict[str, RegisteredFunction] = {}
+        # Immutable copy of the registry for the request path, replaced whole on
+        # every registration so readers never need the lock.
+        self._routes: "MappingProxyType[str, RegisteredFunction]" = MappingProxyType({})
+        # The list_endpoints reply, rebuilt with the snapshot (Response is frozen)
+        self._endpoints_response = Response(STATUS_OK, ())
+        # Request class -> handler, so handle_request dispatches with one lookup
+        self._commands: Dict[type, Callable[[Any], Response]] = {
+            CallRequest: self._handle_call,
+            ListEndpointsRequest: self._handle_list_endpoints,
+            CacheStatsRequest: self._handle_cache_stats,
+        }
         self._lock = threading.Lock()
-        self._server_socket: Optional[socket.socket] = None
+        self._listeners: List[socket.socket] = []
+        self._unix_path: Optional[str] = None
         self._host = host or DEFAULT_HOST
-        self._port = find_free_port(self._host)
+        # Assigned by the kernel when the first listener binds port 0, then kept
+        # for later restarts. An explicit port is shared with sibling processes
+        # through SO_REUSEPORT.
+        self._port: Optional[int] = port
+        self._unix_socket = unix_socket
         self._running = threading.Event()
+        # Set by stop(): run_forever() blocks on it instead of polling ``_running``
+        self._stop_requested = threading.Event()
         self._record: Optional[ServiceRecord] = None
         self._frozen = False
 
@@ -190,19 +709,36 @@ class ServiceServer:
         )
 
         # Thread pool for concurrent request handling
-        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor: Optional[_WorkerPool] = None
+        self._queue_limit = 0
         self._create_executor()
 
-        # Server thread
-        self._server_thread: Optional[threading.Thread] = None
+        # One accept thread per listener (TCP and, for loopback services, UNIX-domain)
+        self._server_threads: List[threading.Thread] = []
+        # Written once by stop() and never drained, so it wakes every accept
+        # thread at once instead of each polling the running flag.
+        self._stop_r: Optional[socket.socket] = None
+        self._stop_w: Optional[socket.socket] = None
+
+        # Idle connections wait in a selector owned by the reactor thread instead
+        # of pinning a worker each; workers hand them over through ``_parked``.
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wake_r: Optional[socket.socket] = None
+        self._wake_w: Optional[socket.socket] = None
+        self._parked: Deque[_Connection] = deque()
+        self._reactor_thread: Optional[threading.Thread] = None
+        self._waiting = 0
+        self._waiting_lock = threading.Lock()
+        # Connections handed to the executor and not yet returned; stop() waits
+        # on ``_idle`` for them instead of shutting the (reusable) executor down.
+        self._active = 0
+        self._idle = threading.Condition(self._waiting_lock)
 
     def _create_executor(self) -> None:
         if self._executor is None:
             workers = _compute_worker_count()
-            self._executor = ThreadPoolExecutor(
-                max_workers=workers,
-                thread_name_prefix=f"MetaBridge-exec[{self._name}]",
-            )
+            self._executor = _WorkerPool(workers, f"MetaBridge-exec[{self._name}]")
+            self._queue_limit = _compute_queue_limit(workers)
 
     @property
     def name(self) -> str:
@@ -218,15 +754,14 @@ class ServiceServer:
     def _resolve_factory(
         self, func: Callable[..., Any], name: str
     ) -> CallableFactory:
-        owner = getattr(func, "metabridge_owner", None)
-        attr_name = getattr(func, "metabridge_attr", name)
-        descriptor = getattr(func, "metabridge_descriptor", "instance")
-
-        if owner is None:
+        meta = _ENDPOINT_META.get(func)
+        if meta is None or meta.owner is None:
             return _FunctionFactory(func)
-        if descriptor in {"staticmethod", "classmethod"}:
-            return _StaticLikeFactory(owner, attr_name)
-        return _InstanceMethodFactory(owner, attr_name)
+
+        attr_name = meta.attr or name
+        if meta.descriptor in {"staticmethod", "classmethod"}:
+            return _StaticLikeFactory(meta.owner, attr_name)
+        return _InstanceMethodFactory(meta.owner, attr_name)
 
     def register(
         self,
@@ -244,74 +779,171 @@ class ServiceServer:
                 raise MetaBridgeError(f"Endpoint '{name}' is already registered")
             resolved_factory = factory or self._resolve_factory(func, name)
             self._registry[name] = RegisteredFunction(name, func, resolved_factory)
+            self._routes = MappingProxyType(dict(self._registry))
+            self._endpoints_response = Response(STATUS_OK, tuple(sorted(self._registry)))
 
     def start(self, *, daemon_thread: bool = True) -> None:
-        if self._server_thread and self._server_thread.is_alive():
+        if any(thread.is_alive() for thread in self._server_threads):
             return
 
         self._running.set()
+        self._stop_requested.clear()
         self._create_executor()
 
-        # Create server socket
-        self._server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self._server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self._server_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-        self._server_socket.bind((self._host, self._port))
-        self._server_socket.listen(128)  # High backlog for concurrent connections
-
-        self._server_thread = threading.Thread(
-            target=self._serve_loop,
-            name=f"MetaBridge[{self._name}]",
-            daemon=daemon_thread,
-        )
-        self._server_thread.start()
+        # Create server sockets. With several listeners, SO_REUSEPORT lets the
+        # kernel spread incoming connections across their accept queues.
+        listener_count = _compute_listener_count()
+        backlog = _listen_backlog()
+        for _ in range(listener_count):
+            server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if hasattr(socket, "SO_REUSEPORT"):
+                # Also lets other processes serving this port share the accept queue
+                try:
+                    server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                except OSError:
+                    pass
+            server_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            for option in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+                try:
+                    server_socket.setsockopt(socket.SOL_SOCKET, option, _SOCKET_BUFFER_SIZE)
+                except OSError:
+                    pass  # Capped or refused by the kernel: keep its default
+            server_socket.bind((self._host, self._port or 0))
+            if not self._port:
+                # Bound for real in one step: no window for another process to
+                # take the port between choosing and binding it
+                self._port = server_socket.getsockname()[1]
+            server_socket.listen(backlog)
+            self._listeners.append(server_socket)
+
+        # Same-host clients skip the TCP/IP stack through a UNIX-domain socket,
+        # whatever interface the TCP listener is bound to.
+        if self._unix_socket and hasattr(socket, "AF_UNIX"):
+            self._bind_unix_listener()
+
+        self._start_reactor()
+
+        self._stop_r, self._stop_w = socket.socketpair()
+        for index, listener in enumerate(self._listeners):
+            thread = threading.Thread(
+                target=self._serve_loop,
+                args=(listener,),
+                name=f"MetaBridge[{self._name}]#{index}",
+                daemon=daemon_thread,
+            )
+            thread.start()
+            self._server_threads.append(thread)
+
+    def _bind_unix_listener(self) -> None:
+        path = _unix_socket_path(self._name)
+        unix_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            on_disk = not path.startswith("\0")
+            if on_disk and os.path.exists(path):
+                os.unlink(path)
+            unix_socket.bind(path)
+            if on_disk:
+                os.chmod(path, 0o600)
+            unix_socket.listen(_listen_backlog())
+        except OSError:
+            unix_socket.close()
+            if self._logger:
+                self._logger.warning(
+                    "Unable to bind UNIX-domain socket, serving over TCP only", exc_info=True
+                )
+            return
+
+        self._listeners.append(unix_socket)
+        self._unix_path = path
 
     def stop(self, timeout: float = 5.0) -> None:
-        if not self._running.is_set() and self._server_thread is None:
+        if not self._running.is_set() and not self._server_threads:
             return
 
         if self._logger:
             self._logger.info(f"Service [bold cyan]'{self.name}'[/bold cyan] stopping...")
 
         self._running.clear()
+        self._stop_requested.set()
 
-        # Close server socket to interrupt accept()
-        if self._server_socket:
+        # Wake the accept threads and let them exit before closing their
+        # sockets, so none of them ever touches a closed listener
+        if self._stop_w is not None:
             try:
-                self._server_socket.close()
-            except Exception:
+                self._stop_w.send(b"\0")
+            except OSError:
+                pass
+        for thread in self._server_threads:
+            if thread.is_alive():
+                thread.join(timeout=timeout)
+        self._server_threads = []
+        for stop_socket in (self._stop_r, self._stop_w):
+            if stop_socket is not None:
+                stop_socket.close()
+        self._stop_r = self._stop_w = None
+        for listener in self._listeners:
+            try:
+                listener.close()
+            except OSError:
                 pass
-            self._server_socket = None
+        self._listeners = []
 
-        # Wait for server thread
-        thread = self._server_thread
-        if thread and thread.is_alive():
-            thread.join(timeout=timeout)
-        self._server_thread = None
+        # Wake the reactor so it closes the idle connections and exits
+        self._wake()
+        if self._reactor_thread is not None:
+            self._reactor_thread.join(timeout=timeout)
+            self._reactor_thread = None
 
-        # Shutdown executor
-        if self._executor:
-            self._executor.shutdown(wait=True, cancel_futures=False)
-            self._executor = None
+        if self._unix_path and not self._unix_path.startswith("\0"):
+            try:
+                os.unlink(self._unix_path)
+            except OSError:
+                pass
+        self._unix_path = None
+
+        # Let in-flight connections finish; the executor itself is kept so a
+        # later start() reuses its threads (see close())
+        with self._idle:
+            self._idle.wait_for(lambda: not self._active, timeout=timeout)
 
         # Unregister from registry
         if self._record:
-            unregister_service(self._name, expected_pid=self._record.pid)
+            # The port check spares a record re-published by another server of this process
+            unregister_service(
+                self._name, expected_pid=self._record.pid, expected_port=self._record.port
+            )
+            _untrack_published(self._record)
             self._record = None
 
         if self._logger:
             self._logger.info(f"Service [bold cyan]'{self.name}'[/bold cyan] stopped.")
 
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop serving and release the worker threads for good."""
+        self.stop(timeout=timeout)
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
     def set_frozen(self, value: bool) -> None:
         with self._lock:
             self._frozen = value
 
     def publish(self) -> ServiceRecord:
         if self._record is not None:
+            # Re-assert our record in case another server of this process replaced it
+            register_service(self._record)
             return self._record
+        if self._port is None:
+            raise MetaBridgeError(f"Service '{self._name}' must be started before it is published")
 
         record = ServiceRecord(
-            name=self._name, host=self._host, port=self._port, pid=os.getpid()
+            name=self._name,
+            host=self._host,
+            port=self._port,
+            pid=os.getpid(),
+            unix_path=self._unix_path,
         )
         register_service(record)
         if self._logger:
@@ -319,22 +951,25 @@ class ServiceServer:
             self._logger.info(
                 f"Service [bold cyan]'{self.name}'[/bold cyan] published with [bold yellow]{endpoints_count}[/bold yellow] endpoint(s) on [green]{self._host}:{self._port}[/green] (PID: {record.pid})"
             )
-        atexit.register(
-            lambda: unregister_service(record.name, expected_pid=record.pid)
-        )
+        _track_published(record)
         self._record = record
         return record
 
-    def run_forever(self, *, poll_interval: float = 0.5) -> None:
-        """Block the current thread while the service keeps handling requests."""
+    def run_forever(self, *, poll_interval: float = 0.5, publish: bool = True) -> None:
+        """
+        Block the current thread while the service keeps handling requests.
+
+        ``poll_interval`` is accepted for compatibility only: the thread now
+        sleeps until stop() is called instead of waking up periodically. With
+        ``publish=False`` the service is not written to the registry (used by
+        the extra processes of a daemon that shares its port).
+        """
         self.start()
-        self.publish()
+        if publish:
+            self.publish()
 
         try:
-            while True:
-                if not self._running.is_set():
-                    break
-                time.sleep(poll_interval)
+            self._stop_requested.wait()
         except KeyboardInterrupt:
             pass
         finally:
@@ -344,130 +979,383 @@ class ServiceServer:
         with self._lock:
             return [(name, entry.func) for name, entry in self._registry.items()]
 
-    def _serve_loop(self) -> None:
-        """Main server loop accepting connections."""
+    def _serve_loop(self, listener: socket.socket) -> None:
+        """Main server loop accepting connections on ``listener``."""
         if self._logger:
             self._logger.info("Server loop started, listening for connections...")
-        while self._running.is_set():
+        stop_r = self._stop_r
+        assert stop_r is not None
+        # Sleep in select() until a client connects or stop() writes to the stop
+        # socket: no periodic wake-ups and no shutdown delay.
+        listener.setblocking(False)
+        with selectors.DefaultSelector() as selector:
+            selector.register(listener, selectors.EVENT_READ)
+            selector.register(stop_r, selectors.EVENT_READ)
+            while self._running.is_set():
+                for key, _ in selector.select():
+                    if key.fileobj is stop_r:
+                        return
+                    # Drain the accept queue: a burst of connections costs one
+                    # select() instead of one per client
+                    while True:
+                        try:
+                            client_socket, _addr = listener.accept()
+                        except BlockingIOError:
+                            break
+                        except OSError:
+                            return
+                        # Workers use plain blocking I/O on client sockets
+                        client_socket.setblocking(True)
+                        conn = self._open_connection(client_socket)
+                        if not self._try_dispatch(conn):
+                            # Every worker is backed up: nothing has been asked
+                            # yet, so the new client simply waits in the reactor
+                            self._park(conn)
+
+    def _start_reactor(self) -> None:
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+        self._reactor_thread = threading.Thread(
+            target=self._reactor_loop,
+            name=f"MetaBridge-reactor[{self._name}]",
+            daemon=True,
+        )
+        self._reactor_thread.start()
+
+    def _wake(self) -> None:
+        wake_w = self._wake_w
+        if wake_w is not None:
             try:
-                # Accept with timeout to check running flag periodically
-                if self._server_socket is None:
-                    break
-                self._server_socket.settimeout(0.1)
-                client_socket, addr = self._server_socket.accept()
-
-                # Handle in thread pool for concurrency
-                if self._executor:
-                    self._executor.submit(self._handle_client, client_socket)
-                else:
-                    # Fallback for immediate execution if executor is gone
-                    self._handle_client(client_socket)
-
-            except socket.timeout:
-                continue
+                wake_w.send(b"\0")
             except OSError:
+                pass  # Buffer full (a wake-up is already pending) or reactor gone
+
+    def _reactor_loop(self) -> None:
+        """Watch idle connections and hand each one to a worker once it has data."""
+        # Kept locally: after a stop() that gave up waiting, a restart installs
+        # a new selector and wake pair, which this loop must neither use nor reset.
+        selector, wake_r, wake_w = self._selector, self._wake_r, self._wake_w
+        assert selector is not None and wake_r is not None and wake_w is not None
+        try:
+            while self._running.is_set() and self._selector is selector:
+                for key, _ in selector.select():
+                    conn = key.data
+                    if conn is None:
+                        self._register_parked(selector, wake_r)
+                    elif conn.outgoing is not None:
+                        self._resume_sending(selector, conn)
+                    else:
+                        selector.unregister(key.fileobj)
+                        self._dispatch(conn)
+        finally:
+            for key in list(selector.get_map().values()):
+                if key.data is not None:
+                    self._close_connection(key.data)
+            current = self._selector is selector
+            if current:
+                # Parked connections belong to a newer reactor otherwise
+                while self._parked:
+                    self._close_connection(self._parked.popleft())
+            selector.close()
+            wake_r.close()
+            wake_w.close()
+            if current:
+                self._selector = self._wake_r = self._wake_w = None
+
+    def _register_parked(self, selector: selectors.BaseSelector, wake_r: socket.socket) -> None:
+        try:
+            while wake_r.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+        while True:
+            try:
+                conn = self._parked.popleft()
+            except IndexError:
                 break
+            events = selectors.EVENT_READ if conn.outgoing is None else selectors.EVENT_WRITE
+            selector.register(conn.sock, events, conn)
 
-    def _handle_client(self, client_socket: socket.socket) -> None:
-        """Handle a single client connection."""
-        client_addr = "unknown"
+    def _resume_sending(self, selector: selectors.BaseSelector, conn: _Connection) -> None:
+        """Write more of the replies pending on ``conn`` now that it is writable."""
+        assert conn.outgoing is not None
         try:
-            peer = client_socket.getpeername()
-            client_addr = f"{peer[0]}:{peer[1]}"
-            if self._logger:
-                self._logger.info(
-                    f"Client connected: [bold magenta]{client_addr}[/bold magenta]"
-                )
+            sent = _send_nowait(conn.sock, conn.outgoing)
+        except BlockingIOError:
+            return
+        except OSError:
+            selector.unregister(conn.sock)
+            self._close_connection(conn)
+            return
+        rest = _unsent(conn.outgoing, sent)
+        if rest:
+            conn.outgoing = rest
+            return
+        conn.outgoing = None
+        if conn.start != conn.end:
+            # Requests already buffered would never make the socket readable
+            selector.unregister(conn.sock)
+            self._dispatch(conn)
+        else:
+            selector.modify(conn.sock, selectors.EVENT_READ, conn)
 
+    def _open_connection(self, client_socket: socket.socket) -> _Connection:
+        is_tcp = client_socket.family != getattr(socket, "AF_UNIX", None)
+        label = "unix"
+        quickack = False
+        if is_tcp:
             client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if _TCP_QUICKACK is not None:
+                # Delayed ACKs would stall multi-segment requests by up to 40 ms
+                try:
+                    client_socket.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+                    quickack = True
+                except OSError:
+                    pass
+            try:
+                peer = client_socket.getpeername()
+                label = f"{peer[0]}:{peer[1]}"
+            except OSError:
+                label = "unknown"
+        if self._logger:
+            self._logger.info(f"Client connected: [bold magenta]{label}[/bold magenta]")
+        return _Connection(client_socket, label, quickack=quickack)
 
-            while self._running.is_set():
-                # Read message length (4 bytes)
-                length_bytes = client_socket.recv(4)
-                if not length_bytes:
-                    break
-
-                message_length = struct.unpack("!I", length_bytes)[0]
+    def _close_connection(self, conn: _Connection) -> None:
+        if self._logger:
+            self._logger.info(f"Client disconnected: [bold magenta]{conn.label}[/bold magenta]")
+        conn.sock.close()
+
+    def _dispatch(self, conn: _Connection) -> None:
+        """Give ``conn`` to a worker thread, or turn it away if too many are queued."""
+        if not self._try_dispatch(conn):
+            self._reject(conn)
+
+    def _try_dispatch(self, conn: _Connection) -> bool:
+        """Queue ``conn`` for a worker; False (and ``conn`` untouched) when the queue is full."""
+        executor = self._executor
+        if executor is None or not self._running.is_set():
+            self._close_connection(conn)
+            return True
+        with self._waiting_lock:
+            if self._waiting >= self._queue_limit:
+                return False
+            self._waiting += 1
+            self._active += 1
+        try:
+            executor.submit(self._serve_connection, conn)
+        except RuntimeError:
+            # The executor is shutting down
+            with self._idle:
+                self._waiting -= 1
+                self._active -= 1
+                if not self._active:
+                    self._idle.notify_all()
+            self._close_connection(conn)
+        return True
+
+    def _reject(self, conn: _Connection) -> None:
+        """Answer the pending request of ``conn`` with an overload error and close it."""
+        if self._logger:
+            self._logger.warning(f"Too many queued connections, rejecting {conn.label}")
+        try:
+            conn.sock.send(_OVERLOADED_REPLY, _MSG_DONTWAIT)
+        except OSError:
+            pass
+        self._close_connection(conn)
 
-                # Read message data
-                data = b""
-                while len(data) < message_length:
-                    chunk = client_socket.recv(
-                        min(4096, message_length - len(data))
-                    )
-                    if not chunk:
-                        break
-                    data += chunk
+    def _park(self, conn: _Connection) -> None:
+        """Return an idle ``conn`` to the reactor, freeing the current worker."""
+        if not self._running.is_set():
+            self._close_connection(conn)
+            return
+        self._parked.append(conn)
+        self._wake()
 
-                if len(data) < message_length:
+    def _serve_connection(self, conn: _Connection) -> None:
+        with self._waiting_lock:
+            self._waiting -= 1
+        try:
+            self._serve(conn)
+        finally:
+            with self._idle:
+                self._active -= 1
+                if not self._active:
+                    self._idle.notify_all()
+
+    def _serve(self, conn: _Connection) -> None:
+        """Handle requests on ``conn`` until it goes idle, closes or must yield."""
+        client_socket = conn.sock
+        # The codecs are shared and reentrant; bind their methods once per
+        # hand-off instead of looking them up for every message.
+        decode = REQUEST_DECODER.decode
+        encode_into = ENCODER.encode_into
+        pack_length = LENGTH_PREFIX.pack
+        pack_length_into = LENGTH_PREFIX.pack_into
+        unpack_length = LENGTH_PREFIX.unpack_from
+        handle_request = self.handle_request
+        running = self._running.is_set
+        quickack = conn.quickack
+        deadline = time.monotonic() + _TIME_SLICE
+
+        # Unparsed bytes are buffer[start:end]. Reads take whatever the kernel
+        # has (up to the free space), so pipelined requests arrive several per
+        # recv and their responses leave together in one send.
+        buffer, start, end = conn.buffer, conn.start, conn.end
+        # Replies are framed back to back in this thread's reusable buffer:
+        # ``queued`` of them fill all of it, ``extra`` holds the zero-copy
+        # payload of a BinaryResult that must follow them.
+        out = _reply_buffer()
+        queued = 0
+        extra: Optional[List[Any]] = None
+        try:
+            while running():
+                available = end - start
+                needed = 4
+                if available >= 4:
+                    needed += unpack_length(buffer, start)[0]
+                    if available >= needed:
+                        frame_end = start + needed
+                        try:
+                            request = decode(memoryview(buffer)[start + 4 : frame_end])
+                        except msgspec.ValidationError as exc:
+                            # Well-formed msgpack, wrong shape (e.g. an unknown
+                            # ``type``): the framing is intact, so just say so
+                            response = Response(STATUS_ERROR, error=("ProtocolError", str(exc)))
+                        else:
+                            response = handle_request(request)
+                        start = frame_end
+                        offset = len(out) if queued else 0
+                        if type(response.result) is BinaryResult:
+                            # Framed around the caller's buffer, never copied:
+                            # only its header joins the queued replies
+                            head, data, trailer = binary_response_segments(response.result)
+                            out[offset:] = pack_length(len(head) + len(data) + len(trailer)) + head
+                            extra = [data, trailer]
+                        else:
+                            # Encoded behind 4 reserved bytes, length packed in place
+                            encode_into(response, out, offset + 4)
+                            pack_length_into(out, offset, len(out) - offset - 4)
+                        queued += 1
+                        if extra is None and queued < _MAX_BATCHED_REPLIES:
+                            continue
+
+                # No complete request left: answer what was processed
+                if queued:
+                    buffers = [out] if extra is None else [out, *extra]
+                    extra = None
+                    queued = 0
+                    if not self._send_replies(conn, buffers):
+                        # The client is not reading: its worker goes back to the
+                        # pool and the reactor finishes the send before serving more.
+                        conn.buffer, conn.start, conn.end = buffer, start, end
+                        self._park(conn)
+                        return
+                    if self._waiting and time.monotonic() >= deadline:
+                        # Other connections are queued for a worker: requeue behind them.
+                        # A busy connection skips the reactor, it would be woken at once.
+                        conn.buffer, conn.start, conn.end = buffer, start, end
+                        if self._try_dispatch(conn):
+                            return
+                        # The queue is full: keep serving rather than drop a live client
+                        deadline = time.monotonic() + _TIME_SLICE
+                    continue
+
+                if start == end:
+                    start = end = 0
+                    if len(buffer) > _RECV_BUFFER_LIMIT:
+                        buffer = bytearray(_READ_SIZE)
+                    # With connections queued for a worker, one that has gone
+                    # quiet goes back to the reactor at once instead of idling
+                    idle_wait = 0.0 if self._waiting else _IDLE_HANDOFF
+                    if not _wait_readable(client_socket, idle_wait):
+                        conn.buffer, conn.start, conn.end = buffer, 0, 0
+                        self._park(conn)
+                        return
+                elif len(buffer) - start < needed:
+                    # Make room for the rest of the frame at the front of the buffer
+                    if needed > len(buffer):
+                        grown = bytearray(max(needed, _READ_SIZE))
+                        grown[:available] = buffer[start:end]
+                        buffer = grown
+                    else:
+                        buffer[:available] = buffer[start:end]
+                    start, end = 0, available
+
+                received = client_socket.recv_into(memoryview(buffer)[end:])
+                if not received:
                     break
-
-                # Process request
-                request = msgpack.unpackb(data, raw=False)
-                response = self.handle_request(request)
-
-                # Send response
-                response_data = msgpack.packb(response, use_bin_type=True)
-                client_socket.sendall(
-                    struct.pack("!I", len(response_data)) + response_data
-                )
+                end += received
+                if quickack:
+                    client_socket.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
 
         except Exception:
             if self._logger:
-                self._logger.error(f"Error handling client {client_addr}", exc_info=True)
-        finally:
-            if self._logger:
-                self._logger.info(
-                    f"Client disconnected: [bold magenta]{client_addr}[/bold magenta]"
-                )
-            client_socket.close()
-
-    def handle_request(self, request: JsonDict) -> JsonDict:
+                self._logger.error(f"Error handling client {conn.label}", exc_info=True)
+        self._close_connection(conn)
+
+    @staticmethod
+    def _send_replies(conn: _Connection, buffers: List[Any]) -> bool:
+        """Send ``buffers``, or keep what would block in ``conn.outgoing`` and return False."""
+        if not _DEFER_WRITES:
+            send_buffers(conn.sock, buffers)
+            return True
+        try:
+            sent = _send_nowait(conn.sock, buffers)
+        except BlockingIOError:
+            sent = 0
+        rest = _unsent(buffers, sent)
+        if not rest:
+            return True
+        conn.outgoing = rest
+        return False
+
+    def handle_request(self, request: Request) -> Response:
         """Process a request and return response."""
-
-        def _truncate(s: Any, max_len: int = 100) -> str:
-            """Truncates a string representation."""
-            s_repr = repr(s)
-            return s_repr[:max_len] + "..." if len(s_repr) > max_len else s_repr
-
-        command = request.get("type")
-
-        if command == "list_endpoints":
-            with self._lock:
-                return {"status": "ok", "result": sorted(self._registry.keys())}
-
-        if command != "call":
-            return {
-                "status": "error",
-                "error": {"type": "ProtocolError", "message": "Unknown command"},
-            }
-
-        endpoint = str(request.get("endpoint"))
-        args = list(request.get("args", []))
-        kwargs = dict(request.get("kwargs", {}))
-        ctor_args = list(request.get("ctor_args", []))
-        ctor_kwargs = dict(request.get("ctor_kwargs", {}))
-
-        # O lock foi removido aqui para performance. O registro é "somente leitura"
-        # após o início do servidor, e leituras de dict são atômicas (thread-safe).
-        callable_entry = self._registry.get(endpoint)
+        handler = self._commands.get(type(request))
+        if handler is None:
+            return Response(STATUS_ERROR, error=("ProtocolError", "Unknown command"))
+        return handler(request)
+
+    def _handle_list_endpoints(self, request: ListEndpointsRequest) -> Response:
+        return self._endpoints_response
+
+    def _handle_cache_stats(self, request: CacheStatsRequest) -> Response:
+        stats = {
+            name: entry.factory.cache_stats()
+            for name, entry in self._routes.items()
+            if isinstance(entry.factory, _InstanceMethodFactory)
+        }
+        return Response(STATUS_OK, stats)
+
+    def _handle_call(self, request: CallRequest) -> Response:
+        endpoint = request.endpoint
+        # O decoder já entrega tuplas, listas e dicts novos e tipados: repassá-los sem copiar.
+        args = request.args
+        kwargs = request.kwargs
+        ctor_args = request.ctor_args
+        ctor_kwargs = request.ctor_kwargs
+
+        # Sem lock: `_routes` é um snapshot imutável, trocado por inteiro a cada
+        # registro, então a leitura nunca vê o dicionário no meio de uma alteração.
+        callable_entry = self._routes.get(endpoint)
 
         if callable_entry is None:
             if self._logger:
                 self._logger.warning(
                     f"Request for unknown endpoint '[bold yellow]{endpoint}[/bold yellow]'"
                 )
-            return {
-                "status": "error",
-                "error": {
-                    "type": "NotFound",
-                    "message": f"Endpoint '{endpoint}' not found",
-                },
-            }
+            return Response(
+                STATUS_ERROR, error=("NotFound", f"Endpoint '{endpoint}' not found")
+            )
 
         try:
             result = callable_entry.invoke(args, kwargs, ctor_args, ctor_kwargs)
-            if self._logger:
+            # Build the log line only if it will be emitted
+            if self._logger is not None and self._logger.isEnabledFor(logging.INFO):
                 log_args = ", ".join(_truncate(a) for a in args)
                 log_kwargs = ", ".join(f"{k}={_truncate(v)}" for k, v in kwargs.items())
                 full_args = f"({log_args}{', ' if log_args and log_kwargs else ''}{log_kwargs})"
@@ -476,17 +1364,14 @@ class ServiceServer:
                 self._logger.info(
                     f"Call [bold green]{self._name}.{endpoint}{full_args}[/bold green] -> [cyan]Success[/cyan] | Result: [yellow]{log_result}[/yellow]"
                 )
-            return {"status": "ok", "result": result}
+            return Response(STATUS_OK, result)
         except Exception as exc:
             if self._logger:
                 self._logger.error(
                     f"Call to '[bold red]{self._name}.{endpoint}[/bold red]' -> [magenta]Failed[/magenta]",
                     exc_info=True,
                 )
-            return {
-                "status": "error",
-                "error": {"type": exc.__class__.__name__, "message": str(exc)},
-            }
+            return Response(STATUS_ERROR, error=(exc.__class__.__name__, str(exc)))
 
 
 class ServiceBuilder:
@@ -530,6 +1415,15 @@ class ServiceBuilder:
         self._server.stop()
         return DaemonServiceBuilder(self._server, bootstrap=False)
 
+    def close(self) -> None:
+        """Stop the in-process server and withdraw its registry record."""
+        self._server.close()
+
+    def republish(self) -> None:
+        """Publish the in-process server's record again if it is still serving."""
+        if self._server._running.is_set():
+            self._server.publish()
+
 
 class DaemonHandle:
     """Represents a background MetaBridge daemon process."""
@@ -539,9 +1433,13 @@ class DaemonHandle:
         service_name: str,
         process: multiprocessing.Process,
         cleanup: Callable[["DaemonHandle"], None] | None = None,
+        *,
+        workers: Sequence[multiprocessing.Process] = (),
     ) -> None:
         self._service_name = service_name
         self._process = process
+        # Extra processes accepting on the same port; only ``process`` publishes
+        self._workers = tuple(workers)
         self._cleanup = cleanup
         self._stopped = False
 
@@ -560,11 +1458,12 @@ class DaemonHandle:
         if self._stopped:
             return
 
-        if self._process.is_alive():
-            self._process.terminate()
-            self._process.join(timeout=timeout)
-        else:
-            self._process.join(timeout=timeout)
+        processes = (self._process, *self._workers)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join(timeout=timeout)
 
         unregister_service(self._service_name, expected_pid=self.pid)
         self._stopped = True
@@ -575,6 +1474,8 @@ class DaemonHandle:
 
     def join(self, timeout: Optional[float] = None) -> None:
         self._process.join(timeout)
+        for process in self._workers:
+            process.join(timeout)
 
 
 class DaemonServiceBuilder(ServiceBuilder):
@@ -590,9 +1491,22 @@ class DaemonServiceBuilder(ServiceBuilder):
         poll_interval: float = 0.5,
         wait: bool = False,
         startup_timeout: float = 5.0,
+        processes: int = 1,
     ) -> DaemonHandle:
+        """
+        Start the service in a background process and wait until it is published.
+
+        With ``processes > 1`` that many processes serve the service over one
+        TCP port, bound with SO_REUSEPORT so the kernel spreads connections
+        across them. Each keeps its own instance cache, so this suits endpoints
+        that do not rely on state shared between calls.
+        """
         if self._handle and self._handle.is_running():
             raise MetaBridgeError("Daemon is already running for this service")
+        if processes < 1:
+            raise MetaBridgeError("A daemon needs at least one process")
+        if processes > 1 and not hasattr(socket, "SO_REUSEPORT"):
+            raise MetaBridgeError("Running a daemon in several processes requires SO_REUSEPORT")
 
         endpoints = self._server.snapshot_registry()
         if not endpoints:
@@ -610,23 +1524,50 @@ class DaemonServiceBuilder(ServiceBuilder):
             _unregister_daemon_handle(handle)
             self._server.set_frozen(False)
 
-        process = _spawn_daemon_process(
-            self._server.name, endpoints, poll_interval, logger_enabled
-        )
-        handle = DaemonHandle(self._server.name, process, cleanup=_cleanup)
-
+        host = self._server._host
+        # Held until the primary listens, so the port cannot be taken meanwhile
+        reservation = _reserve_shared_port(host) if processes > 1 else None
         try:
-            _await_service_start(self._server.name, timeout=startup_timeout)
-        except Exception:
-            handle.stop(timeout=0.5)
-            raise
+            shared_port = reservation.getsockname()[1] if reservation is not None else None
+            process = _spawn_daemon_process(
+                self._server.name,
+                endpoints,
+                poll_interval,
+                logger_enabled,
+                host=host,
+                shared_port=shared_port,
+                reservation=reservation,
+            )
+            workers = [
+                _spawn_daemon_process(
+                    self._server.name,
+                    endpoints,
+                    poll_interval,
+                    logger_enabled,
+                    host=host,
+                    shared_port=shared_port,
+                    reservation=reservation,
+                    primary=False,
+                )
+                for _ in range(processes - 1)
+            ]
+            handle = DaemonHandle(self._server.name, process, cleanup=_cleanup, workers=workers)
+
+            try:
+                _await_service_start(self._server.name, timeout=startup_timeout)
+            except Exception:
+                handle.stop(timeout=0.5)
+                raise
+        finally:
+            if reservation is not None:
+                reservation.close()
 
         self._handle = handle
         _register_daemon_handle(handle)
 
         if wait:
             try:
-                process.join()
+                handle.join()
             except KeyboardInterrupt:
                 handle.stop()
 
@@ -640,12 +1581,34 @@ def create_service(
     return ServiceBuilder(server)
 
 
+def _reserve_shared_port(host: str) -> socket.socket:
+    """Bind a SO_REUSEPORT socket to a port the kernel picks, for a daemon's processes to share."""
+    reservation = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        reservation.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        reservation.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        # Bound but never listening: it keeps the port and receives no connections
+        reservation.bind((host, 0))
+    except OSError:
+        reservation.close()
+        raise
+    return reservation
+
+
 def _spawn_daemon_process(
     name: str,
     endpoints: List[EndpointSpec],
     poll_interval: float,
     logger_enabled: bool,
+    *,
+    host: Optional[str] = None,
+    shared_port: Optional[int] = None,
+    reservation: Optional[socket.socket] = None,
+    primary: bool = True,
 ) -> multiprocessing.Process:
+    # fork stays the first choice: the child inherits the endpoint classes as
+    # they are, where spawn/forkserver would re-import ``__main__`` (which
+    # usually calls ``meta.run()`` itself).
     try:
         ctx: BaseContext = multiprocessing.get_context("fork")
     except ValueError:
@@ -653,11 +1616,30 @@ def _spawn_daemon_process(
 
     process = ctx.Process(
         target=_daemon_worker,
-        args=(name, endpoints, poll_interval, logger_enabled),
+        args=(
+            name,
+            endpoints,
+            poll_interval,
+            logger_enabled,
+            host,
+            shared_port,
+            reservation,
+            primary,
+        ),
         daemon=False,
         name=f"MetaBridge-daemon[{name}]",
     )
-    process.start()
+    freeze = ctx.get_start_method() == "fork" and hasattr(gc, "freeze")
+    if freeze:
+        # Objects inherited from the parent move to the permanent generation, so
+        # the child's collector never writes to them and the parent's heap stays
+        # shared copy-on-write instead of being duplicated page by page.
+        gc.freeze()
+    try:
+        process.start()
+    finally:
+        if freeze:
+            gc.unfreeze()
     return process
 
 
@@ -666,19 +1648,44 @@ def _daemon_worker(
     endpoints: List[EndpointSpec],
     poll_interval: float,
     logger_enabled: bool,
+    host: Optional[str] = None,
+    shared_port: Optional[int] = None,
+    reservation: Optional[socket.socket] = None,
+    primary: bool = True,
 ) -> None:
-    server = ServiceServer(name, logger=logger_enabled)
+    if reservation is not None:
+        # The parent's copy keeps the port reserved until this process binds it
+        reservation.close()
+    # Processes sharing a port serve TCP only: a UNIX-domain socket is per
+    # process and would send every same-host client to the one published.
+    server = ServiceServer(
+        name,
+        host,
+        logger=logger_enabled,
+        port=shared_port,
+        unix_socket=shared_port is None,
+    )
     for endpoint_name, func in endpoints:
         server.register(endpoint_name, func)
-    server.run_forever(poll_interval=poll_interval)
+    server.run_forever(poll_interval=poll_interval, publish=primary)
+
+
+_STARTUP_POLL_MAX = 0.02
 
 
 def _await_service_start(name: str, *, timeout: float) -> None:
     deadline = time.perf_counter() + timeout
-    while time.perf_counter() < deadline:
+    # Exponential backoff: a fast child is picked up within a millisecond or
+    # two, a slow one costs a registry lookup every 20 ms at most.
+    delay = 0.001
+    while True:
         try:
             resolve_service(name)
             return
         except ServiceNotFound:
-            time.sleep(0.01)  # Much shorter sleep for faster startup
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(_STARTUP_POLL_MAX, delay * 1.5)
     raise MetaBridgeError(f"Service '{name}' did not start within {timeout:.1f}s")
\ No newline at end of file
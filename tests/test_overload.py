@@ -0,0 +1,56 @@
+import threading
+import time
+import uuid
+
+import pytest
+
+import metabridge as meta
+from metabridge.server import ServiceServer
+
+
+@pytest.fixture
+def busy_service(monkeypatch, tmp_path):
+    """A service with one worker and room for a single queued connection."""
+    monkeypatch.setattr("metabridge.registry.REGISTRY_PATH", str(tmp_path / "registry.msgpack"))
+    monkeypatch.setattr("metabridge.registry._LOCK_PATH", str(tmp_path / "registry.msgpack.lock"))
+    monkeypatch.setenv("META_WORKERS", "1")
+    monkeypatch.setenv("META_QUEUE", "1")
+    name = f"overload-{uuid.uuid4().hex[:8]}"
+    server = ServiceServer(name)
+    server.register("slow", lambda seconds: time.sleep(seconds) or seconds)
+    server.start()
+    server.publish()
+    yield name
+    server.close()
+
+
+def test_retry_after_rejection_uses_a_fresh_connection(busy_service):
+    clients = [meta.connect(busy_service) for _ in range(3)]
+    # Let the pre-connected sockets settle in the reactor before loading the worker
+    time.sleep(0.05)
+    busy = [threading.Thread(target=client.slow, args=(0.5,)) for client in clients[:2]]
+    for thread in busy:
+        thread.start()
+        time.sleep(0.1)  # the first call holds the worker, the second fills the queue
+
+    rejected = clients[2]
+    errors = []
+    deadline = time.monotonic() + 5
+    result = None
+    while time.monotonic() < deadline:
+        try:
+            result = rejected.slow(0)
+            break
+        except meta.RemoteExecutionError as exc:
+            errors.append(str(exc))
+            time.sleep(0.05)
+
+    for thread in busy:
+        thread.join()
+    for client in clients:
+        client.close()
+
+    assert errors, "the call was expected to be turned away at least once"
+    # Every failure is the overload reply itself, never a reused dead socket
+    assert all("Overloaded" in error for error in errors), errors
+    assert result == 0